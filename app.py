@@ -1,34 +1,47 @@
 import os
 import logging
+from startup import startup_phase
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
 from werkzeug.middleware.proxy_fix import ProxyFix
+from db_routing import RoutingSession, engine_options, REPLICA_BIND
 
 logging.basicConfig(level=logging.DEBUG)
 
 class Base(DeclarativeBase):
     pass
 
-db = SQLAlchemy(model_class=Base)
+db = SQLAlchemy(model_class=Base, session_options={'class_': RoutingSession})
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SESSION_SECRET", "truthlens-secret-key-2024")
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
 app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL")
-app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
-    "pool_recycle": 300,
-    "pool_pre_ping": True,
-}
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(os.environ.get("DATABASE_URL"))
+
+# Optional read replica for read-only views (see db_routing.read_only)
+if os.environ.get("DATABASE_REPLICA_URL"):
+    app.config["SQLALCHEMY_BINDS"] = {
+        REPLICA_BIND: {
+            "url": os.environ["DATABASE_REPLICA_URL"],
+            **engine_options(os.environ["DATABASE_REPLICA_URL"], prefix="DB_REPLICA")
+        }
+    }
 
 db.init_app(app)
 
+# The schema is migrated by the gunicorn on_starting hook, `python migrations.py`
+# or the development entry points below, never as a side effect of importing the app
 with app.app_context():
     import models
-    db.create_all()
 
-import routes
+with startup_phase('routes_import'):
+    import routes
 
 if __name__ == '__main__':
+    import migrations
+    with app.app_context():
+        migrations.upgrade_on_startup(db.engine)
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
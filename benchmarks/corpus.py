@@ -0,0 +1,101 @@
+"""Deterministic synthetic claim corpus for the benchmark suite.
+
+Four kinds of text, mixed in fixed proportions:
+
+- tweet: one or two short sentences, often with a number, a hashtag or a link
+- article: several paragraphs of news-style prose with embedded claims
+- known_false: phrases the rule pack flags (5G harm, election fraud, miracle cures, ...)
+- viral: near-duplicate variants of a few base claims, as a claim spreads
+"""
+import random
+from typing import Dict, List
+
+SUBJECTS = ['the city council', 'a new study', 'the health ministry', 'researchers at a university',
+            'the central bank', 'local officials', 'a government report', 'scientists', 'the company',
+            'an independent survey']
+VERBS = ['reported', 'announced', 'found', 'confirmed', 'estimated', 'claimed', 'revealed', 'denied']
+TOPICS = ['unemployment fell by {n} percent', 'vaccination rates rose to {n} percent',
+          'average rents increased by {n} percent', 'emissions dropped {n} percent last year',
+          '{n} million people voted in the election', 'the budget deficit reached {n} billion dollars',
+          'water usage grew by {n} percent', '{n} percent of schools reopened', 'crime rates fell {n} percent',
+          'the new policy will cost {n} million']
+PLACES = ['in London', 'in Texas', 'across Europe', 'in Nairobi', 'in Ontario', 'nationwide', 'in Delhi', '']
+HASHTAGS = ['#breaking', '#news', '#health', '#election2024', '#climate', '#factcheck', '']
+
+KNOWN_FALSE = [
+    '5G cell towers spread the virus and the radiation is harmful',
+    'The election was rigged and millions of ballots were stolen',
+    'This secret cure prevents all diseases and never fails',
+    'Climate change is a hoax invented by scientists',
+    'The vaccine is toxic and dangerous, they don\'t want you to know',
+    'Drinking 10 glasses of water a day cures everything',
+    'SHOCKING: government cover-up exposed, the moon landing was fake',
+    'Breaking: voting machines flipped votes in every state, fraud confirmed',
+]
+
+VIRAL_BASES = [
+    'Drinking hot water every hour kills the virus in your throat',
+    'The new banknotes contain a tracking chip that reports your location',
+    'Eating two bananas a day prevents all heart disease according to doctors',
+    'Schools will be closed for the rest of the year starting Monday',
+]
+
+MIX = {'tweet': 0.45, 'article': 0.1, 'known_false': 0.25, 'viral': 0.2}
+
+
+def _sentence(rng: random.Random) -> str:
+    topic = rng.choice(TOPICS).format(n=rng.randint(2, 95))
+    place = rng.choice(PLACES)
+    return f"{rng.choice(SUBJECTS).capitalize()} {rng.choice(VERBS)} that {topic} {place}".strip() + '.'
+
+
+def tweet(rng: random.Random) -> str:
+    text = ' '.join(_sentence(rng) for _ in range(rng.randint(1, 2)))
+    if rng.random() < 0.3:
+        text += f" https://example.com/{rng.randint(1000, 9999)}"
+    return f"{text} {rng.choice(HASHTAGS)}".strip()
+
+
+def article(rng: random.Random) -> str:
+    paragraphs = []
+    for _ in range(rng.randint(4, 8)):
+        sentences = [_sentence(rng) for _ in range(rng.randint(3, 6))]
+        if rng.random() < 0.4:
+            sentences.insert(rng.randrange(len(sentences)), f"According to experts, {rng.choice(KNOWN_FALSE).lower()}.")
+        paragraphs.append(' '.join(sentences))
+    return '\n\n'.join(paragraphs)
+
+
+def known_false(rng: random.Random) -> str:
+    text = rng.choice(KNOWN_FALSE)
+    return f"{text} {rng.choice(HASHTAGS)}".strip() if rng.random() < 0.5 else text
+
+
+def viral(rng: random.Random) -> str:
+    """A reworded copy of a base claim: case, punctuation, a prefix or a trailing hashtag"""
+    text = rng.choice(VIRAL_BASES)
+    variant = rng.randrange(5)
+    if variant == 1:
+        text = text.upper()
+    elif variant == 2:
+        text = f"{text}!!!"
+    elif variant == 3:
+        text = f"{rng.choice(['RT:', 'Forwarded:', 'Please share:'])} {text}"
+    elif variant == 4:
+        text = f"{text} {rng.choice(HASHTAGS)}".strip()
+    return text
+
+
+GENERATORS = {'tweet': tweet, 'article': article, 'known_false': known_false, 'viral': viral}
+
+
+def build_corpus(size: int = 500, seed: int = 1234) -> List[Dict[str, str]]:
+    """size texts as {'kind', 'text'}; the same size and seed always give the same corpus"""
+    rng = random.Random(seed)
+    kinds = list(MIX)
+    weights = [MIX[kind] for kind in kinds]
+    corpus = []
+    for _ in range(size):
+        kind = rng.choices(kinds, weights)[0]
+        corpus.append({'kind': kind, 'text': GENERATORS[kind](rng)})
+    return corpus
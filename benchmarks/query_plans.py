@@ -0,0 +1,114 @@
+"""Query plans and timings for the dashboard, search and trend access paths,
+before and after the index migration.
+
+    python benchmarks/query_plans.py --rows 10000000 --database-url sqlite:////tmp/plans.db
+
+The database is seeded at schema version 1 (no secondary indexes), each query
+is explained and timed, then the index migration (version 2) alone is
+applied and the queries are explained and timed again. Use a throwaway
+database.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import migrations
+
+STATUSES = ['true', 'mostly true', 'mixed', 'mostly false', 'false']
+INDEX_MIGRATION = 2
+CATEGORIES = ['health', 'politics', 'finance', 'environment', 'technology', 'general']
+
+QUERIES = {
+    'dashboard_recent_claims': (
+        "SELECT id, claim_text, status FROM claim ORDER BY created_at DESC LIMIT 10", {}
+    ),
+    'dashboard_status_count': (
+        "SELECT COUNT(*) FROM claim WHERE status = :status", {'status': 'false'}
+    ),
+    'trend_lookup': (
+        "SELECT id, claim_count FROM trend_data WHERE category = :category AND date_recorded = :day",
+        {'category': 'health', 'day': datetime(2024, 1, 15)}
+    ),
+    'search_by_credibility': (
+        "SELECT id, claim_text FROM claim WHERE credibility_score >= :score "
+        "ORDER BY credibility_score DESC LIMIT 20", {'score': 8.0}
+    ),
+}
+
+
+def seed(engine, rows: int, chunk_size: int = 50000):
+    start = datetime(2024, 1, 1)
+    random.seed(42)
+    with engine.begin() as connection:
+        inserted = 0
+        while inserted < rows:
+            batch = []
+            for i in range(inserted, min(inserted + chunk_size, rows)):
+                created_at = start + timedelta(seconds=i * 3)
+                batch.append({
+                    'claim_text': f'Synthetic claim {i}',
+                    'credibility_score': round(random.uniform(0, 10), 1),
+                    'status': random.choice(STATUSES),
+                    'created_at': created_at,
+                    'updated_at': created_at
+                })
+            connection.execute(text(
+                "INSERT INTO claim (claim_text, credibility_score, status, created_at, updated_at) "
+                "VALUES (:claim_text, :credibility_score, :status, :created_at, :updated_at)"
+            ), batch)
+            inserted += len(batch)
+            print(f"  seeded {inserted}/{rows} claims", end='\r', flush=True)
+        print()
+
+        days = max(rows // 10000, 30)
+        connection.execute(text(
+            "INSERT INTO trend_data (category, claim_count, false_claim_count, date_recorded) "
+            "VALUES (:category, :claims, :false_claims, :day)"
+        ), [
+            {'category': category, 'claims': 100, 'false_claims': 20, 'day': start + timedelta(days=day)}
+            for day in range(days) for category in CATEGORIES
+        ])
+
+
+def explain(connection, sql: str, params: dict) -> str:
+    if connection.dialect.name == 'postgresql':
+        rows = connection.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params).fetchall()
+        return "\n".join(row[0] for row in rows)
+    rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def report(engine, label: str, repeat: int):
+    print(f"\n=== {label} ===")
+    with engine.connect() as connection:
+        for name, (sql, params) in QUERIES.items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                connection.execute(text(sql), params).fetchall()
+                timings.append(time.perf_counter() - started)
+            print(f"\n[{name}] best of {repeat}: {min(timings) * 1000:.2f} ms")
+            print(explain(connection, sql, params))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default='sqlite:////tmp/truthlens_query_plans.db')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    migrations.upgrade(engine, target=1)
+    seed(engine, args.rows)
+    report(engine, 'before (schema version 1)', args.repeat)
+
+    started = time.perf_counter()
+    version = migrations.upgrade(engine, target=INDEX_MIGRATION)
+    print(f"\nMigrated to version {version} in {time.perf_counter() - started:.1f} s")
+    report(engine, f'after (schema version {version})', args.repeat)
@@ -0,0 +1,235 @@
+"""Latency and throughput benchmarks for verify_claim, extract_claims and /api/fact-check.
+
+    python benchmarks/suite.py --size 500 --output results.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --tolerance 0.2
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+
+Each benchmark runs over the same synthetic corpus (benchmarks/corpus.py)
+and reports throughput, p50/p95/p99 latency and the process's peak RSS after
+it ran. The Google Fact Check API is replaced by a local stub server
+(--stub-latency simulates network time), the verdict cache is disabled unless
+--cache is given, and the API benchmark uses the Flask test client against a
+throwaway SQLite database. With --baseline, any benchmark whose p95 or peak
+RSS grew, or whose throughput dropped, by more than the tolerance is
+reported and the exit status is 1. Compare baselines from the same machine.
+"""
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Callable, Optional
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from corpus import build_corpus
+
+BENCHMARKS = ['verify_claim', 'extract_claims', 'api_fact_check']
+
+
+class StubFactCheckHandler(BaseHTTPRequestHandler):
+    """Answers claims:search like the Google Fact Check Tools API, after an optional delay"""
+
+    latency = 0.0
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        query = parse_qs(urlparse(self.path).query).get('query', [''])[0]
+        body = json.dumps({'claims': [{
+            'text': query[:200],
+            'claimant': 'Social media posts',
+            'claimReview': [{
+                'publisher': {'name': 'Stub Fact Check'},
+                'url': 'https://factcheck.example.com/review',
+                'textualRating': 'False' if len(query) % 2 else 'Misleading'
+            }]
+        }]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(latency: float) -> ThreadingHTTPServer:
+    handler = type('Handler', (StubFactCheckHandler,), {'latency': latency})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, name='stub-factcheck', daemon=True).start()
+    return server
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(name: str, call: Callable[[str], Any], texts: List[str], warmup: int) -> Dict[str, Any]:
+    for text in texts[:warmup]:
+        call(text)
+
+    latencies = []
+    started = time.perf_counter()
+    for text in texts:
+        call_started = time.perf_counter()
+        call(text)
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        'calls': len(latencies),
+        'seconds': round(elapsed, 4),
+        'throughput_per_second': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3),
+        'peak_rss_mb': peak_rss_mb()
+    }
+    print(f"{name:16} {result['throughput_per_second']:>9.1f}/s  p50 {result['p50_ms']:>8.2f} ms  "
+          f"p95 {result['p95_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  rss {result['peak_rss_mb']:>7.1f} MB")
+    return result
+
+
+def configure_environment(args, stub_url: str):
+    """Point the app at the stub API and a fresh database before anything imports it"""
+    os.environ['GOOGLE_FACT_CHECK_API_KEY'] = 'benchmark-key'
+    os.environ['FACT_CHECK_API_URL'] = stub_url
+    if not args.cache:
+        os.environ['VERDICT_CACHE_BACKEND'] = 'none'
+    os.environ.pop('CLAIM_DEDUP_ANSWER', None)
+
+    if args.database_url:
+        os.environ['DATABASE_URL'] = args.database_url
+    else:
+        path = os.path.join(tempfile.gettempdir(), 'truthlens_benchmark.db')
+        if os.path.exists(path):
+            os.remove(path)
+        os.environ['DATABASE_URL'] = f'sqlite:///{path}'
+
+
+def run(args) -> Dict[str, Any]:
+    corpus = build_corpus(args.size, args.seed)
+    texts = [item['text'] for item in corpus]
+    short_texts = [item['text'] for item in corpus if item['kind'] != 'article']
+    selected = args.only or BENCHMARKS
+
+    server = start_stub_server(args.stub_latency / 1000)
+    configure_environment(args, f'http://127.0.0.1:{server.server_port}/v1alpha1/claims:search')
+
+    results = {}
+    try:
+        if 'verify_claim' in selected:
+            from fact_checker import FactChecker
+            checker = FactChecker()
+            results['verify_claim'] = measure('verify_claim', checker.verify_claim, short_texts, args.warmup)
+
+        if 'extract_claims' in selected:
+            from nlp_processor import NLPProcessor
+            processor = NLPProcessor()
+            results['extract_claims'] = measure('extract_claims', processor.extract_claims, texts, args.warmup)
+
+        if 'api_fact_check' in selected:
+            import migrations
+            from app import app, db
+            with app.app_context():
+                migrations.upgrade(db.engine)
+            client = app.test_client()
+
+            def post_claim(text):
+                response = client.post('/api/fact-check', json={'claim': text})
+                if response.status_code != 200:
+                    raise RuntimeError(f"/api/fact-check returned {response.status_code}: {response.get_data(as_text=True)}")
+
+            results['api_fact_check'] = measure('api_fact_check', post_claim, short_texts, args.warmup)
+    finally:
+        server.shutdown()
+
+    return {
+        'recorded_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'corpus': {'size': args.size, 'seed': args.seed,
+                   'kinds': {kind: sum(1 for item in corpus if item['kind'] == kind)
+                             for kind in sorted({item['kind'] for item in corpus})}},
+        'stub_latency_ms': args.stub_latency,
+        'verdict_cache': bool(args.cache),
+        'benchmarks': results
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Regressions of results against a baseline, as human-readable lines"""
+    regressions = []
+    for name, current in results['benchmarks'].items():
+        previous = baseline.get('benchmarks', {}).get(name)
+        if not previous:
+            continue
+        for metric in ('p95_ms', 'peak_rss_mb'):
+            if previous[metric] and current[metric] > previous[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {previous[metric]} -> {current[metric]}")
+        if current['throughput_per_second'] < previous['throughput_per_second'] * (1 - tolerance):
+            regressions.append(f"{name}: throughput_per_second {previous['throughput_per_second']} -> "
+                               f"{current['throughput_per_second']}")
+
+    if baseline.get('corpus', {}).get('size') != results['corpus']['size']:
+        print("warning: baseline was recorded with a different corpus size")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=500, help='number of corpus texts')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--warmup', type=int, default=20, help='untimed calls before each benchmark')
+    parser.add_argument('--only', action='append', choices=BENCHMARKS, help='run only these benchmarks')
+    parser.add_argument('--stub-latency', type=float, default=0.0, help='stub Fact Check API delay in ms')
+    parser.add_argument('--cache', action='store_true', help='keep the verdict cache enabled')
+    parser.add_argument('--database-url', help='database for the API benchmark (default: fresh SQLite file)')
+    parser.add_argument('--output', help='write results as JSON')
+    parser.add_argument('--baseline', help='compare against a results file and fail on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative regression')
+    parser.add_argument('--save-baseline', help='write results as the new baseline')
+    args = parser.parse_args(argv)
+
+    results = run(args)
+
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\nRegressions beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,11 @@
+// Development API endpoint; batches go to <apiEndpoint>/batch, i.e. /api/fact-check/batch
+const DEFAULT_API_ENDPOINT = 'https://edb45802-7c53-4151-8ab6-8345c51197d9-00-252w1l9x7npln.kirk.replit.dev/api/fact-check';
+
 // Create context menu item
 chrome.runtime.onInstalled.addListener(function() {
     // Set default API endpoint for development
     chrome.storage.local.set({
-        'apiEndpoint': 'https://edb45802-7c53-4151-8ab6-8345c51197d9-00-252w1l9x7npln.kirk.replit.dev/api/fact-check'
+        'apiEndpoint': DEFAULT_API_ENDPOINT
     });
 
     // Create context menu
@@ -91,28 +94,76 @@ async function checkFactsWithCache(text) {
     }
 }
 
-async function checkFacts(text) {
-    const apiEndpoint = await new Promise(resolve => {
+// Requests made within a short window are sent together to the batch endpoint
+const BATCH_WINDOW = 50; // milliseconds
+const MAX_BATCH_SIZE = 50;
+let pendingBatch = [];
+let batchTimer = null;
+
+function getApiEndpoint() {
+    return new Promise(resolve => {
         chrome.storage.local.get('apiEndpoint', data => {
-            resolve(data.apiEndpoint || 'https://3ca07954-0922-4e21-bc41-b6f08b5b7439-00-tulse2fj8yli.worf.replit.dev/analyze');
+            resolve(data.apiEndpoint || DEFAULT_API_ENDPOINT);
         });
     });
+}
 
-    console.log('Making request to:', apiEndpoint); // Debug log
-
-    const response = await fetch(apiEndpoint, {
-        method: 'POST',
-        headers: {
-            'Content-Type': 'application/json'
-        },
-        body: JSON.stringify({ content: text })
+function checkFacts(text) {
+    return new Promise((resolve, reject) => {
+        pendingBatch.push({ text, resolve, reject });
+        if (pendingBatch.length >= MAX_BATCH_SIZE) {
+            flushBatch();
+        } else if (!batchTimer) {
+            batchTimer = setTimeout(flushBatch, BATCH_WINDOW);
+        }
     });
+}
 
-    if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
+async function flushBatch() {
+    clearTimeout(batchTimer);
+    batchTimer = null;
+    const batch = pendingBatch;
+    pendingBatch = [];
+    if (batch.length === 0) {
+        return;
     }
 
-    const data = await response.json();
-    console.log('API Response:', data); // Debug log
-    return data;
-}
\ No newline at end of file
+    try {
+        const apiEndpoint = await getApiEndpoint();
+        const batchEndpoint = `${apiEndpoint.replace(/\/$/, '')}/batch`;
+
+        console.log('Making batch request to:', batchEndpoint, batch.length); // Debug log
+
+        const response = await fetch(batchEndpoint, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                claims: batch.map((item, index) => ({ id: index, content: item.text }))
+            })
+        });
+
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+
+        const data = await response.json();
+        console.log('API Response:', data); // Debug log
+
+        data.results.forEach(item => {
+            const request = batch[item.id];
+            if (!request) {
+                return;
+            }
+            if (item.success) {
+                // Same shape as the single-claim endpoint
+                request.resolve({ success: true, results: [item.result] });
+            } else {
+                request.reject(new Error(item.error || 'Fact-check failed'));
+            }
+        });
+    } catch (error) {
+        batch.forEach(request => request.reject(error));
+    }
+}
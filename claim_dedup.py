@@ -0,0 +1,139 @@
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Set, Tuple
+from sqlalchemy import or_
+from app import db
+from models import Claim
+from minhash import claim_features, claim_guard, fingerprint_columns, jaccard, BANDS
+from trend_store import record_trends
+
+DEDUP_ENABLED = os.environ.get('CLAIM_DEDUP', '1').lower() not in ('0', 'false', 'no')
+DEDUP_THRESHOLD = float(os.environ.get('CLAIM_DEDUP_THRESHOLD', 0.9))
+DEDUP_MAX_CANDIDATES = int(os.environ.get('CLAIM_DEDUP_MAX_CANDIDATES', 50))
+ANSWER_FROM_CANONICAL = os.environ.get('CLAIM_DEDUP_ANSWER', '').lower() in ('1', 'true', 'yes')
+ANSWER_MAX_AGE = float(os.environ.get('CLAIM_DEDUP_ANSWER_MAX_AGE', 86400))
+
+
+def _band_keys(mapping: Dict[str, Any]) -> List[Tuple[int, int]]:
+    return [(band, mapping[f'lsh_band{band}']) for band in range(BANDS) if mapping.get(f'lsh_band{band}') is not None]
+
+
+def find_canonical(mapping: Dict[str, Any], features: Optional[Set[str]] = None) -> Optional[int]:
+    """Id of the stored claim the mapping is a near-duplicate of, if any.
+
+    An exact fingerprint match is one index probe; otherwise the claims
+    sharing an LSH band key are fetched and the most similar one at or above
+    DEDUP_THRESHOLD (word/bigram Jaccard) with the same numbers and negations
+    (claim_guard) wins.
+    """
+    exact = db.session.query(Claim.id).filter(
+        Claim.fingerprint == mapping['fingerprint']
+    ).order_by(Claim.id).first()
+    if exact is not None:
+        return exact[0]
+
+    band_keys = _band_keys(mapping)
+    if not band_keys:
+        return None
+
+    candidates = db.session.query(Claim.id, Claim.claim_text).filter(
+        or_(*[getattr(Claim, f'lsh_band{band}') == key for band, key in band_keys])
+    ).order_by(Claim.id).limit(DEDUP_MAX_CANDIDATES).all()
+
+    features = features if features is not None else claim_features(mapping['claim_text'])
+    guard = claim_guard(mapping['claim_text'])
+    best_id, best_similarity = None, 0.0
+    for claim_id, claim_text in candidates:
+        if claim_guard(claim_text) != guard:
+            continue
+        similarity = jaccard(features, claim_features(claim_text))
+        if similarity >= DEDUP_THRESHOLD and similarity > best_similarity:
+            best_id, best_similarity = claim_id, similarity
+    return best_id
+
+
+def absorb_duplicates(mappings: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Tuple[str, int]]]:
+    """Split claim mappings into rows to insert and near-duplicates of known claims.
+
+    A near-duplicate of a stored claim, or of an earlier mapping in the same
+    batch, is not inserted: the canonical claim's hit_count is incremented
+    instead and the submission is still counted in the trend rollups, all in
+    the current session transaction. Returns the mappings to insert and, for
+    each input, ('existing', claim_id) or ('new', index into those mappings).
+    """
+    if not DEDUP_ENABLED:
+        return mappings, [('new', index) for index in range(len(mappings))]
+
+    to_insert = []
+    outcomes = []
+    absorbed = []
+    hits: Dict[int, int] = {}
+    batch_fingerprints: Dict[str, int] = {}
+    batch_bands: Dict[Tuple[int, int], List[int]] = {}
+    batch_features: List[Set[str]] = []
+    batch_guards: List[Tuple[Tuple[str, ...], Tuple[str, ...]]] = []
+
+    for mapping in mappings:
+        features = claim_features(mapping['claim_text'])
+        guard = claim_guard(mapping['claim_text'])
+
+        # Earlier rows of this batch are not in the table yet
+        match = batch_fingerprints.get(mapping['fingerprint'])
+        if match is None:
+            candidates = {index for key in _band_keys(mapping) for index in batch_bands.get(key, [])}
+            similar = [(jaccard(features, batch_features[index]), index)
+                       for index in sorted(candidates) if batch_guards[index] == guard]
+            similar = [item for item in similar if item[0] >= DEDUP_THRESHOLD]
+            if similar:
+                match = max(similar, key=lambda item: (item[0], -item[1]))[1]
+        if match is not None:
+            to_insert[match]['hit_count'] = to_insert[match].get('hit_count', 1) + 1
+            outcomes.append(('new', match))
+            absorbed.append(mapping)
+            continue
+
+        canonical_id = find_canonical(mapping, features)
+        if canonical_id is not None:
+            hits[canonical_id] = hits.get(canonical_id, 0) + 1
+            outcomes.append(('existing', canonical_id))
+            absorbed.append(mapping)
+            continue
+
+        index = len(to_insert)
+        to_insert.append(dict(mapping))  # copied: hit_count may change and a failed flush retries the inputs
+        batch_features.append(features)
+        batch_guards.append(guard)
+        batch_fingerprints[mapping['fingerprint']] = index
+        for key in _band_keys(mapping):
+            batch_bands.setdefault(key, []).append(index)
+        outcomes.append(('new', index))
+
+    for claim_id, count in hits.items():
+        db.session.query(Claim).filter(Claim.id == claim_id).update(
+            {'hit_count': Claim.hit_count + count}, synchronize_session=False
+        )
+    if absorbed:
+        record_trends(db.session.connection(), absorbed)
+
+    return to_insert, outcomes
+
+
+def canonical_verdict(claim_text: str) -> Optional[Dict[str, Any]]:
+    """Stored verdict of a recent near-duplicate, when CLAIM_DEDUP_ANSWER is enabled.
+
+    Lets repeat submissions of a viral claim skip verification entirely.
+    """
+    if not (DEDUP_ENABLED and ANSWER_FROM_CANONICAL):
+        return None
+
+    mapping = {'claim_text': claim_text, **fingerprint_columns(claim_text)}
+    canonical_id = find_canonical(mapping)
+    if canonical_id is None:
+        return None
+
+    claim = db.session.get(Claim, canonical_id)
+    if claim is None or claim.status == 'error':
+        return None
+    if claim.created_at and datetime.utcnow() - claim.created_at > timedelta(seconds=ANSWER_MAX_AGE):
+        return None
+    return claim.to_result()
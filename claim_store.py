@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from app import db
+from models import Claim, Report
+import stats_service  # registers the claim status counter listeners
+import trend_store  # registers the daily trend counter listener
+from write_buffer import write_buffer
+from claim_dedup import absorb_duplicates
+from minhash import fingerprint_columns
+from metrics import time_stage
+
+
+def claim_mapping(claim_text: str, result: Dict[str, Any],
+                  country: Optional[str] = None, region: Optional[str] = None) -> Dict[str, Any]:
+    """Column values for a Claim row built from a verify_claim result"""
+    now = datetime.utcnow()
+    return {
+        'claim_text': claim_text,
+        'credibility_score': result.get('credibility_score', 0.0),
+        'status': result.get('status', 'pending'),
+        'category': result.get('category'),
+        'country': country,
+        'region': region,
+        'sources': result.get('sources', []),
+        'reasoning': result.get('reasoning', ''),
+        'risk_level': result.get('risk_level'),
+        'analysis_factors': result.get('analysis_factors'),
+        'real_facts': result.get('real_facts'),
+        'factual_news': result.get('factual_news'),
+        'hit_count': 1,
+        **fingerprint_columns(claim_text),
+        'created_at': now,
+        'updated_at': now
+    }
+
+
+def claim_from_result(claim_text: str, result: Dict[str, Any],
+                      country: Optional[str] = None, region: Optional[str] = None) -> Claim:
+    """Build a Claim row from a verify_claim result"""
+    return Claim(**claim_mapping(claim_text, result, country, region))
+
+
+def save_claims(items: List[Tuple[str, Dict[str, Any]]], buffered: Optional[bool] = None,
+                country: Optional[str] = None, region: Optional[str] = None) -> List[Claim]:
+    """Insert the verified claims in a single flush and commit.
+
+    country and region record where the claims were submitted from, for the
+    geographic trend rollups. Near-duplicates of stored claims are not inserted
+    (see claim_dedup); the canonical claim is returned in their place. In
+    write-behind mode (CLAIM_WRITE_BEHIND) the rows are queued instead and the
+    returned claims are transient, without an id. Pass buffered=False when the
+    caller needs the ids.
+    """
+    if buffered is None:
+        buffered = write_buffer is not None
+
+    if not items:
+        return []
+    mappings = [claim_mapping(claim_text, result, country, region) for claim_text, result in items]
+    # A full buffer refuses the rows; they are then written through like unbuffered ones
+    if buffered and write_buffer is not None and write_buffer.add_claims(mappings):
+        return [Claim(**mapping) for mapping in mappings]
+
+    to_insert, outcomes = absorb_duplicates(mappings)
+    claims = [Claim(**mapping) for mapping in to_insert]
+    db.session.add_all(claims)
+    with time_stage('db_commit'):
+        db.session.commit()
+    return [claims[index] if kind == 'new' else db.session.get(Claim, index) for kind, index in outcomes]
+
+
+def save_claim(claim_text: str, result: Dict[str, Any], buffered: Optional[bool] = None,
+               country: Optional[str] = None, region: Optional[str] = None) -> Claim:
+    """Insert a single verified claim"""
+    return save_claims([(claim_text, result)], buffered=buffered, country=country, region=region)[0]
+
+
+def save_report(fields: Dict[str, Any]) -> Report:
+    """Insert a user report, or queue it in write-behind mode (the returned report then has no id)"""
+    if write_buffer is not None:
+        mapping = {'priority': 'medium', 'status': 'pending', 'created_at': datetime.utcnow(), **fields}
+        if write_buffer.add_report(mapping):
+            return Report(**mapping)
+
+    report = Report(**fields)
+    db.session.add(report)
+    with time_stage('db_commit'):
+        db.session.commit()
+    return report
@@ -0,0 +1,77 @@
+import logging
+import threading
+from typing import Callable, Dict, Any, List
+
+
+class ComponentRegistry:
+    """Owns exactly one instance of each engine (FactChecker, NLPProcessor) per worker process"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._building = threading.local()
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """Register the factory used to build a component on first use"""
+        with self._lock:
+            self._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        """Return the shared instance of a component, building it if needed"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                if name not in self._factories:
+                    raise KeyError(f"Unknown component '{name}'")
+                self._building.active = True
+                try:
+                    instance = self._factories[name]()
+                finally:
+                    self._building.active = False
+                self._instances[name] = instance
+                logging.info(f"Component '{name}' initialized")
+        return instance
+
+    def warm(self, names: List[str] = None) -> Dict[str, Any]:
+        """Build every (or the named) registered component ahead of the first request"""
+        return {name: self.get(name) for name in (names or list(self._factories))}
+
+    def is_building(self) -> bool:
+        return getattr(self._building, 'active', False)
+
+
+registry = ComponentRegistry()
+
+
+def ensure_registry_construction(component: Any):
+    """Fail loudly when an engine is constructed inside a request instead of via the registry"""
+    if registry.is_building():
+        return
+    try:
+        from flask import has_request_context
+    except ImportError:
+        return
+    if has_request_context():
+        raise RuntimeError(
+            f"{type(component).__name__} must not be constructed per request; "
+            f"use components.registry.get(...) to share the worker's instance"
+        )
+
+
+def _create_fact_checker():
+    from fact_checker import FactChecker
+    return FactChecker()
+
+
+def _create_nlp_processor():
+    from nlp_processor import NLPProcessor
+    return NLPProcessor()
+
+
+registry.register('fact_checker', _create_fact_checker)
+registry.register('nlp_processor', _create_nlp_processor)
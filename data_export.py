@@ -0,0 +1,122 @@
+import io
+import csv
+import json
+import base64
+from datetime import datetime
+from typing import Dict, Any, Iterator, Optional, Tuple
+from sqlalchemy import select, and_, or_
+from app import db
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque cursor for the (created_at, id) keyset position of a row"""
+    payload = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor; raises ValueError for a malformed cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+
+def _filtered(statement, model, filters: Dict[str, Optional[str]]):
+    for column, value in filters.items():
+        if value:
+            statement = statement.where(getattr(model, column) == value)
+    return statement
+
+
+def _after(model, cursor: str, descending: bool):
+    """Rows strictly past the cursor in (created_at, id) order"""
+    created_at, row_id = decode_cursor(cursor)
+    if descending:
+        return or_(model.created_at < created_at, and_(model.created_at == created_at, model.id < row_id))
+    return or_(model.created_at > created_at, and_(model.created_at == created_at, model.id > row_id))
+
+
+def _ordered(statement, model, descending: bool):
+    if descending:
+        return statement.order_by(model.created_at.desc(), model.id.desc())
+    return statement.order_by(model.created_at, model.id)
+
+
+def keyset_page(model, cursor: Optional[str] = None, limit: int = 100, descending: bool = True,
+                filters: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+    """One page of rows in (created_at, id) order and the cursor of the next page.
+
+    Each page is an index range scan on (created_at, id) starting at the
+    cursor, so deep pages cost the same as the first one.
+    """
+    statement = _filtered(select(model), model, filters or {})
+    if cursor:
+        statement = statement.where(_after(model, cursor, descending))
+    statement = _ordered(statement, model, descending).limit(limit + 1)
+
+    rows = db.session.execute(statement).scalars().all()
+    items = rows[:limit]
+    next_cursor = encode_cursor(items[-1].created_at, items[-1].id) if len(rows) > limit else None
+    return {
+        'items': [row.to_dict() for row in items],
+        'next_cursor': next_cursor
+    }
+
+
+def _serialize(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def stream_export(model, export_format: str = 'ndjson', since: Optional[str] = None,
+                  filters: Optional[Dict[str, Optional[str]]] = None, batch_size: int = 1000) -> Iterator[str]:
+    """Every row in ascending (created_at, id) order as NDJSON lines or CSV.
+
+    Rows are read through a server-side cursor in batches of batch_size
+    without building ORM objects, so memory stays flat however many rows are
+    exported. since resumes after a cursor from an earlier page or export.
+    Run inside the request context (stream_with_context) to keep the session.
+    """
+    table = model.__table__
+    statement = _filtered(select(table), model, filters or {})
+    if since:
+        statement = statement.where(_after(model, since, descending=False))
+    statement = _ordered(statement, model, descending=False).execution_options(
+        stream_results=True, yield_per=batch_size
+    )
+
+    columns = [column.name for column in table.columns]
+    result = db.session.execute(statement).mappings()
+
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for partition in result.partitions():
+            for row in partition:
+                writer.writerow([
+                    json.dumps(row[column]) if isinstance(row[column], (dict, list)) else _serialize(row[column])
+                    for column in columns
+                ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+        return
+
+    for partition in result.partitions():
+        yield ''.join(
+            json.dumps({column: _serialize(row[column]) for column in columns}) + '\n'
+            for row in partition
+        )
+
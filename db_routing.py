@@ -0,0 +1,107 @@
+import os
+import time
+import threading
+import functools
+from typing import Dict, Any, Optional
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+REPLICA_BIND = 'replica'
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.wait_stats = {
+            'checkouts': 0,
+            'timeouts': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0
+        }
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._wait_lock:
+                self.wait_stats['timeouts'] += 1
+            raise
+        waited = time.perf_counter() - started
+        with self._wait_lock:
+            self.wait_stats['checkouts'] += 1
+            self.wait_stats['wait_seconds_total'] += waited
+            self.wait_stats['wait_seconds_max'] = max(self.wait_stats['wait_seconds_max'], waited)
+        return connection
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._wait_lock:
+            stats = dict(self.wait_stats)
+        stats.update({
+            'size': self.size(),
+            'checked_out': self.checkedout(),
+            'overflow': self.overflow(),
+            'checked_in': self.checkedin()
+        })
+        return stats
+
+
+def engine_options(url: Optional[str], prefix: str = 'DB') -> Dict[str, Any]:
+    """Engine options for a database URL, tuned from <prefix>_POOL_* environment variables"""
+    options = {
+        'pool_recycle': int(os.environ.get(f'{prefix}_POOL_RECYCLE', 300)),
+        'pool_pre_ping': True,
+    }
+    # In-memory SQLite is served from a single connection; there is no pool to size
+    if not url or (url.startswith('sqlite') and (':memory:' in url or url.rstrip('/') == 'sqlite:')):
+        return options
+
+    options.update({
+        'poolclass': TimedQueuePool,
+        'pool_size': int(os.environ.get(f'{prefix}_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get(f'{prefix}_MAX_OVERFLOW', 20)),
+        'pool_timeout': float(os.environ.get(f'{prefix}_POOL_TIMEOUT', 10)),
+    })
+    return options
+
+
+class RoutingSession(Session):
+    """Session that sends reads from read-only views to the replica bind.
+
+    Writes (flushes) and explicit binds always use the primary, and without a
+    configured replica everything goes to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context() and g.get('db_read_only'):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def read_only(view):
+    """Route the view's queries to the read replica, when one is configured.
+
+    The flag lives on the application context, so streamed responses keep
+    reading from the replica after the view returns.
+    """
+    @functools.wraps(view)
+    def read_only_view(*args, **kwargs):
+        g.db_read_only = True
+        return view(*args, **kwargs)
+    return read_only_view
+
+
+def pool_stats(db) -> Dict[str, Dict[str, Any]]:
+    """Checkout-wait statistics for every engine with a TimedQueuePool"""
+    stats = {}
+    for name, engine in db.engines.items():
+        if isinstance(engine.pool, TimedQueuePool):
+            stats[name or 'primary'] = engine.pool.get_stats()
+    return stats
@@ -0,0 +1,34 @@
+from typing import Dict, Any
+from sqlalchemy import Table, and_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+
+def increment_counter(connection, table: Table, keys: Dict[str, Any], increments: Dict[str, int]):
+    """Atomically add increments to a counter row, creating it if missing.
+
+    Uses INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and SQLite, so it needs
+    a unique index or primary key on the key columns and is safe under
+    concurrent writers. It runs on the given connection, i.e. in the caller's
+    transaction.
+    """
+    dialect = connection.dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        insert = postgresql_insert if dialect == 'postgresql' else sqlite_insert
+        statement = insert(table).values(**keys, **increments)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={column: table.c[column] + statement.excluded[column] for column in increments}
+        )
+        connection.execute(statement)
+        return
+
+    # Other dialects: update first, insert when no row matched
+    condition = and_(*[table.c[column] == value for column, value in keys.items()])
+    result = connection.execute(
+        table.update().where(condition).values(
+            {column: table.c[column] + amount for column, amount in increments.items()}
+        )
+    )
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(**keys, **increments))
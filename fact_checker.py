@@ -1,86 +1,189 @@
 import os
-import requests
 import json
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
+from rule_engine import MatchSet
+from rule_pack import RulePack, RulePackLoader
+from verdict_cache import create_verdict_cache, normalize_claim
+from factcheck_client import FactCheckClient
+from components import ensure_registry_construction
+from metrics import metrics, time_stage
+from profiler import profile_block, bind_profile
+
+VERIFICATION_ERRORS = metrics.counter(
+    'factcheck_verification_errors_total', 'Verifications that failed and returned an error result'
+)
 
 class FactChecker:
     """Handles fact-checking logic using Google Fact Check API and internal verification"""
     
     def __init__(self):
+        ensure_registry_construction(self)
         self.google_api_key = os.environ.get('GOOGLE_FACT_CHECK_API_KEY', 'demo-key')
-        self.fact_check_url = 'https://factchecktools.googleapis.com/v1alpha1/claims:search'
+        self.fact_check_client = FactCheckClient(self.google_api_key)
+        self.rules = RulePackLoader()
+        self.verdict_cache = create_verdict_cache()
+        self._lookup_executor = None
+        self._lookup_executor_pid = None
         
     def verify_claim(self, claim_text: str) -> Dict[str, Any]:
         """
         Verify a claim using multiple sources and return credibility assessment
         """
+        # Verify exactly the text the cache key is built from, so every claim
+        # that shares a cache entry also gets the same verdict
+        claim_text = normalize_claim(claim_text)
+        with profile_block('verify_claim'):
+            rules = self.rules.current()
+            if self.verdict_cache is None:
+                return self._verify_claim_uncached(claim_text, rules)
+            
+            # Verdicts depend on the rule pack's content, so any rule change starts a fresh keyspace
+            cached = self.verdict_cache.get(claim_text, rules.cache_namespace)
+            if cached is not None:
+                return cached
+            
+            result = self._verify_claim_uncached(claim_text, rules)
+            if result.get('status') != 'error':
+                self.verdict_cache.set(claim_text, result, rules.cache_namespace)
+            return result
+
+    async def verify_claim_async(self, claim_text: str) -> Dict[str, Any]:
+        """
+        Async variant of verify_claim: the external fact-check lookup runs in a
+        worker thread while the local analysis runs, so latency is roughly
+        max(network, CPU) instead of their sum
+        """
+        claim_text = normalize_claim(claim_text)
+        with profile_block('verify_claim'):
+            rules = self.rules.current()
+            if self.verdict_cache is not None:
+                cached = self.verdict_cache.get(claim_text, rules.cache_namespace)
+                if cached is not None:
+                    return cached
+            
+            result = await self._verify_claim_uncached_async(claim_text, rules)
+            if self.verdict_cache is not None and result.get('status') != 'error':
+                self.verdict_cache.set(claim_text, result, rules.cache_namespace)
+            return result
+
+    def _verify_claim_uncached(self, claim_text: str, rules: RulePack) -> Dict[str, Any]:
+        """Run the full verification pipeline for a claim"""
         try:
-            external_results = self._search_external_factchecks(claim_text)
-            internal_analysis = self._analyze_claim_internally(claim_text)
-            analysis_factors = self._get_analysis_factors(external_results, internal_analysis, claim_text)
-            credibility_score = self._calculate_credibility_score(external_results, internal_analysis)
-            status = self._determine_status(credibility_score, claim_text)
-            category = self._extract_category(claim_text)
-            real_facts = self._get_real_facts(claim_text, external_results)
-            factual_news = self._generate_factual_news(claim_text, external_results, credibility_score)
+            matches = rules.scan(claim_text)
+            external_results = self._search_external_factchecks(claim_text, matches)
+            local_analysis = self._analyze_locally(claim_text, matches)
+            return self._build_result(claim_text, rules, matches, external_results, local_analysis)
             
-            return {
-                'credibility_score': credibility_score,
-                'status': status,
-                'category': category,
-                'sources': external_results.get('sources', []),
-                'reasoning': self._generate_reasoning(external_results, internal_analysis, credibility_score),
-                'factual_news': factual_news,
-                'risk_level': self._get_risk_level(credibility_score),
-                'analysis_factors': analysis_factors,
-                'real_facts': real_facts
-            }
+        except Exception as e:
+            logging.error(f"Error in fact verification: {str(e)}")
+            VERIFICATION_ERRORS.inc()
+            return self._error_result()
+
+    async def _verify_claim_uncached_async(self, claim_text: str, rules: RulePack) -> Dict[str, Any]:
+        """Run the verification pipeline with the external lookup overlapping local analysis"""
+        try:
+            matches = rules.scan(claim_text)
+            # bind_profile samples the executor thread into a profiled request's profile
+            lookup = asyncio.get_running_loop().run_in_executor(
+                self._get_lookup_executor(), bind_profile(self._search_external_factchecks), claim_text, matches
+            )
+            local_analysis = self._analyze_locally(claim_text, matches)
+            external_results = await lookup
+            return self._build_result(claim_text, rules, matches, external_results, local_analysis)
             
         except Exception as e:
             logging.error(f"Error in fact verification: {str(e)}")
+            VERIFICATION_ERRORS.inc()
+            return self._error_result()
+
+    def _get_lookup_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for external lookups, created lazily so it never crosses a fork"""
+        if self._lookup_executor is None or self._lookup_executor_pid != os.getpid():
+            self._lookup_executor = ThreadPoolExecutor(
+                max_workers=int(os.environ.get('FACT_CHECK_LOOKUP_THREADS', 8)),
+                thread_name_prefix='factcheck-lookup'
+            )
+            self._lookup_executor_pid = os.getpid()
+        return self._lookup_executor
+
+    def _analyze_locally(self, claim_text: str, matches: MatchSet) -> Dict[str, Any]:
+        """Analysis steps that do not depend on external fact-check results"""
+        with time_stage('local_analysis'):
             return {
-                'credibility_score': 0.0,
-                'status': 'error',
-                'category': 'unknown',
-                'sources': [],
-                'reasoning': 'Unable to verify claim due to technical error.',
-                'external_checks': [],
-                'risk_level': 'high',
-                'analysis_factors': {},
-                'real_facts': []
+                'internal_analysis': self._analyze_claim_internally(claim_text, matches),
+                'category': self._extract_category(matches),
+                'real_facts': self._get_real_facts(matches)
             }
-    
-    def _search_external_factchecks(self, claim_text: str) -> Dict[str, Any]:
+
+    def _build_result(self, claim_text: str, rules: RulePack, matches: MatchSet,
+                      external_results: Dict, local_analysis: Dict) -> Dict[str, Any]:
+        """Combine external results and local analysis into the verification result"""
+        internal_analysis = local_analysis['internal_analysis']
+        with time_stage('scoring'):
+            analysis_factors = self._get_analysis_factors(external_results, internal_analysis, claim_text, matches)
+            credibility_score = self._calculate_credibility_score(external_results, internal_analysis, matches, rules)
+            status = self._determine_status(credibility_score, matches, rules)
+        
+        with time_stage('report_generation'):
+            factual_news = self._generate_factual_news(matches, external_results, credibility_score, rules)
+            reasoning = self._generate_reasoning(external_results, internal_analysis, credibility_score)
+        
+        return {
+            'credibility_score': credibility_score,
+            'status': status,
+            'category': local_analysis['category'],
+            'sources': external_results.get('sources', []),
+            'reasoning': reasoning,
+            'factual_news': factual_news,
+            'risk_level': self._get_risk_level(credibility_score),
+            'analysis_factors': analysis_factors,
+            'real_facts': local_analysis['real_facts']
+        }
+
+    def _error_result(self) -> Dict[str, Any]:
+        """Result returned when verification fails"""
+        return {
+            'credibility_score': 0.0,
+            'status': 'error',
+            'category': 'unknown',
+            'sources': [],
+            'reasoning': 'Unable to verify claim due to technical error.',
+            'external_checks': [],
+            'risk_level': 'high',
+            'analysis_factors': {},
+            'real_facts': []
+        }
+
+    def verify_claims(self, claim_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Verify many claims, returning results in input order. Identical claims
+        within the batch are only verified once.
+        """
+        verified = {}
+        for claim_text in claim_texts:
+            if claim_text not in verified:
+                verified[claim_text] = self.verify_claim(claim_text)
+        return [verified[claim_text] for claim_text in claim_texts]
+
+    def _search_external_factchecks(self, claim_text: str, matches: MatchSet) -> Dict[str, Any]:
         """Search for existing fact-checks using Google Fact Check API"""
-        try:
-            params = {
-                'key': self.google_api_key,
-                'query': claim_text,
-                'languageCode': 'en'
-            }
-            
+        with time_stage('external_lookup'):
             if self.google_api_key == 'demo-key':
-                return self._get_demo_factcheck_data(claim_text)
-            
-            response = requests.get(self.fact_check_url, params=params, timeout=10)
+                return self._get_demo_factcheck_data(matches)
             
-            if response.status_code == 200:
-                data = response.json()
-                return self._process_factcheck_response(data)
-            else:
-                logging.warning(f"Fact Check API returned status {response.status_code}")
+            # Unavailable upstream (errors, open circuit) falls back to internal analysis only
+            data = self.fact_check_client.search(claim_text)
+            if data is None:
                 return {'claims': [], 'sources': []}
-                
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error calling Fact Check API: {str(e)}")
-            return {'claims': [], 'sources': []}
+            
+            return self._process_factcheck_response(data)
     
-    def _get_demo_factcheck_data(self, claim_text: str) -> Dict[str, Any]:
+    def _get_demo_factcheck_data(self, matches: MatchSet) -> Dict[str, Any]:
         """Generate demo fact-check data when API is not available"""
-        claim_lower = claim_text.lower()
-        
-        if any(word in claim_lower for word in ['vaccine', 'covid', 'coronavirus']):
+        if matches.has('demo_health'):
             return {
                 'claims': [
                     {
@@ -92,7 +195,7 @@ class FactChecker:
                 ],
                 'sources': ['WHO', 'CDC', 'Medical Journals']
             }
-        elif any(word in claim_lower for word in ['election', 'vote', 'ballot']):
+        elif matches.has('demo_election'):
             return {
                 'claims': [
                     {
@@ -141,67 +244,22 @@ class FactChecker:
             'sources': list(sources)
         }
     
-    def _analyze_claim_internally(self, claim_text: str) -> Dict[str, Any]:
+    def _analyze_claim_internally(self, claim_text: str, matches: MatchSet) -> Dict[str, Any]:
         """Perform internal analysis of the claim"""
         analysis = {
             'claim_text': claim_text,  
             'word_count': len(claim_text.split()),
-            'has_extreme_language': self._has_extreme_language(claim_text),
+            'has_extreme_language': matches.has('extreme_language'),
             'has_numbers': any(char.isdigit() for char in claim_text),
-            'has_urls': 'http' in claim_text.lower() or 'www.' in claim_text.lower(),
+            'has_urls': matches.has('url_markers'),
             'length_score': min(len(claim_text) / 100, 1.0)  
         }
         
         return analysis
     
-    def _has_extreme_language(self, text: str) -> bool:
-        """Check for extreme or sensational language"""
-        extreme_words = [
-            'shocking', 'unbelievable', 'amazing', 'incredible', 'secret',
-            'government cover-up', 'they don\'t want you to know', 'exposed',
-            'breaking', 'urgent', 'conspiracy', 'hoax'
-        ]
-        text_lower = text.lower()
-        return any(word in text_lower for word in extreme_words)
-    
-    def _calculate_credibility_score(self, external_results: Dict, internal_analysis: Dict) -> float:
+    def _calculate_credibility_score(self, external_results: Dict, internal_analysis: Dict, matches: MatchSet, rules: RulePack) -> float:
         """Calculate overall credibility score from 0.0 to 10.0 based on claim content"""
-        claim_text = internal_analysis.get('claim_text', '').lower()
-        
-        if any(word in claim_text for word in ['all diseases', 'prevent all', 'cure everything', 'never fails']):
-            score = 3.2  # Overly broad medical claims
-        elif any(word in claim_text for word in ['study shows', 'research proves', 'scientists say']):
-            if any(word in claim_text for word in ['new', 'recent', 'latest']):
-                score = 6.1  # Recent research claims - need verification
-            else:
-                score = 7.4  # General research claims
-        elif any(word in claim_text for word in ['vaccine', 'vaccination']):
-            if any(word in claim_text for word in ['dangerous', 'harmful', 'toxic']):
-                score = 1.8  # Anti-vaccine misinformation
-            else:
-                score = 8.6  # General vaccine information
-        elif any(word in claim_text for word in ['water', 'hydration']):
-            if 'glasses' in claim_text and any(word in claim_text for word in ['prevent', 'disease']):
-                score = 4.7  # Mixed evidence for 8 glasses preventing disease
-            else:
-                score = 7.9  # General hydration facts
-        elif any(word in claim_text for word in ['climate change', 'global warming']):
-            if any(word in claim_text for word in ['hoax', 'fake', 'conspiracy']):
-                score = 1.6  # Climate denial
-            else:
-                score = 8.9  # Climate science
-        elif any(word in claim_text for word in ['election', 'voting', 'ballot']):
-            if any(word in claim_text for word in ['fraud', 'rigged', 'stolen']):
-                score = 2.3  # Election fraud claims
-            else:
-                score = 7.7  # General election information
-        elif any(word in claim_text for word in ['5g', 'radiation', 'cell tower']):
-            if any(word in claim_text for word in ['cancer', 'harmful', 'dangerous']):
-                score = 2.9  # 5G health fears
-            else:
-                score = 7.3  # 5G technology facts
-        else:
-            score = 5.8  # Default for general claims
+        score = rules.base_score(matches)
         
         external_claims = external_results.get('claims', [])
         if external_claims:
@@ -232,27 +290,10 @@ class FactChecker:
         # Ensure score is between 0.0 and 10.0
         return max(0.0, min(10.0, score))
     
-    def _determine_status(self, credibility_score: float, claim_text: str = "") -> str:
+    def _determine_status(self, credibility_score: float, matches: MatchSet, rules: RulePack) -> str:
         """Determine claim status based on credibility score and content analysis"""
-        text_lower = claim_text.lower()
-        
-        # Specific false claims that should always be marked as false
-        known_false_claims = [
-            'earth is flat', 'flat earth', 'vaccines cause autism', 
-            'covid vaccine contains microchip', 'vaccine microchip',
-            'drink bleach', 'bleach cure', 'mms cure'
-        ]
-        
-        if any(phrase in text_lower for phrase in known_false_claims):
-            return 'false'
-        
-        # Misinformation language patterns
-        suspicious_patterns = [
-            'doctors hate this', 'one weird trick', 'they don\'t want you to know',
-            'big pharma conspiracy', 'government cover-up', 'secret cure'
-        ]
-        
-        if any(phrase in text_lower for phrase in suspicious_patterns):
+        # Known false claims and misinformation language patterns are always false
+        if rules.is_always_false(matches):
             return 'false'
         
         # Score-based determination with more definitive boundaries
@@ -267,19 +308,17 @@ class FactChecker:
         else:
             return 'false'
     
-    def _extract_category(self, claim_text: str) -> str:
+    def _extract_category(self, matches: MatchSet) -> str:
         """Extract category from claim text"""
-        text_lower = claim_text.lower()
-        
-        if any(word in text_lower for word in ['health', 'medical', 'vaccine', 'doctor', 'disease']):
+        if matches.has('category_health'):
             return 'health'
-        elif any(word in text_lower for word in ['election', 'vote', 'politics', 'government']):
+        elif matches.has('category_politics'):
             return 'politics'
-        elif any(word in text_lower for word in ['money', 'financial', 'economy', 'stock', 'investment']):
+        elif matches.has('category_finance'):
             return 'finance'
-        elif any(word in text_lower for word in ['climate', 'environment', 'global warming']):
+        elif matches.has('category_environment'):
             return 'environment'
-        elif any(word in text_lower for word in ['technology', 'ai', 'computer', 'internet']):
+        elif matches.has('category_technology'):
             return 'technology'
         else:
             return 'general'
@@ -327,7 +366,7 @@ class FactChecker:
         else:
             return 'high'  # Red
     
-    def _get_analysis_factors(self, external_results: Dict, internal_analysis: Dict, claim_text: str) -> Dict[str, Any]:
+    def _get_analysis_factors(self, external_results: Dict, internal_analysis: Dict, claim_text: str, matches: MatchSet) -> Dict[str, Any]:
         """Get detailed analysis factors for the claim"""
         
         # Source Reliability Analysis
@@ -337,10 +376,10 @@ class FactChecker:
         fact_check_matches = self._analyze_fact_check_matches(external_results.get('claims', []))
         
         # Content Analysis
-        content_analysis = self._analyze_content_structure(claim_text, internal_analysis)
+        content_analysis = self._analyze_content_structure(claim_text, internal_analysis, matches)
         
         # Language Analysis
-        language_analysis = self._analyze_language_patterns(claim_text)
+        language_analysis = self._analyze_language_patterns(matches)
         
         # Verification Confidence
         verification_confidence = self._calculate_verification_confidence(external_results, internal_analysis)
@@ -417,16 +456,16 @@ class FactChecker:
             'consensus_strength': 'Strong' if total_matches >= 3 else 'Moderate' if total_matches >= 1 else 'Weak'
         }
     
-    def _analyze_content_structure(self, claim_text: str, internal_analysis: Dict) -> Dict[str, Any]:
+    def _analyze_content_structure(self, claim_text: str, internal_analysis: Dict, matches: MatchSet) -> Dict[str, Any]:
         """Analyze the structure and characteristics of the content"""
         
         # Check for specific claim indicators
         specific_indicators = {
-            'statistics': any(char.isdigit() for char in claim_text) and ('%' in claim_text or 'percent' in claim_text.lower()),
-            'dates': any(word in claim_text.lower() for word in ['2023', '2024', 'recently', 'new study', 'latest']),
-            'authorities': any(word in claim_text.lower() for word in ['doctor', 'expert', 'scientist', 'researcher', 'study']),
-            'absolute_terms': any(word in claim_text.lower() for word in ['all', 'never', 'always', 'every', 'none', 'completely']),
-            'urgency_language': any(word in claim_text.lower() for word in ['urgent', 'breaking', 'shocking', 'immediately'])
+            'statistics': internal_analysis.get('has_numbers', False) and matches.has('statistics_markers'),
+            'dates': matches.has('dates'),
+            'authorities': matches.has('authorities'),
+            'absolute_terms': matches.has('absolute_terms'),
+            'urgency_language': matches.has('urgency_language')
         }
         
         complexity_score = min(10, len(claim_text.split()) / 10)
@@ -441,28 +480,13 @@ class FactChecker:
             'structure_assessment': 'Detailed' if specificity_score >= 6 else 'Moderate' if specificity_score >= 3 else 'Basic'
         }
     
-    def _analyze_language_patterns(self, claim_text: str) -> Dict[str, Any]:
+    def _analyze_language_patterns(self, matches: MatchSet) -> Dict[str, Any]:
         """Analyze language patterns that might indicate reliability issues"""
         
-        emotional_language = any(word in claim_text.lower() for word in [
-            'amazing', 'shocking', 'unbelievable', 'incredible', 'miracle', 
-            'secret', 'hidden', 'they don\'t want', 'conspiracy'
-        ])
-        
-        scientific_language = any(word in claim_text.lower() for word in [
-            'study', 'research', 'evidence', 'data', 'analysis', 'peer-reviewed',
-            'clinical', 'scientific', 'published'
-        ])
-        
-        hedge_words = any(word in claim_text.lower() for word in [
-            'might', 'could', 'possibly', 'potentially', 'suggests', 'indicates',
-            'appears', 'seems'
-        ])
-        
-        certainty_language = any(word in claim_text.lower() for word in [
-            'proves', 'confirms', 'definitely', 'certainly', 'guaranteed',
-            'absolutely', 'without doubt'
-        ])
+        emotional_language = matches.has('emotional_language')
+        scientific_language = matches.has('scientific_language')
+        hedge_words = matches.has('hedge_words')
+        certainty_language = matches.has('certainty_language')
         
         objectivity_score = 0
         if scientific_language:
@@ -500,30 +524,29 @@ class FactChecker:
             'confidence_level': 'High' if overall_confidence >= 7 else 'Medium' if overall_confidence >= 4 else 'Low'
         }
     
-    def _get_real_facts(self, claim_text: str, external_results: Dict) -> List[Dict[str, Any]]:
+    def _get_real_facts(self, matches: MatchSet) -> List[Dict[str, Any]]:
         """Extract real facts and context about the claim"""
         real_facts = []
         
         # Generate actual factual content based on the claim
-        factual_content = self._generate_factual_content(claim_text)
+        factual_content = self._generate_factual_content(matches)
         real_facts.extend(factual_content)
         
         # Add corrective information if claim appears problematic
-        corrective_facts = self._get_corrective_information(claim_text)
+        corrective_facts = self._get_corrective_information(matches)
         real_facts.extend(corrective_facts)
         
         # Add scientific/authoritative information
-        authoritative_facts = self._get_authoritative_information(claim_text)
+        authoritative_facts = self._get_authoritative_information(matches)
         real_facts.extend(authoritative_facts)
         
         return real_facts[:8]  # Limit to top 8 most relevant facts
     
-    def _get_category_specific_facts(self, claim_text: str) -> List[Dict[str, Any]]:
+    def _get_category_specific_facts(self, matches: MatchSet) -> List[Dict[str, Any]]:
         """Get facts specific to the claim's category"""
         facts = []
-        text_lower = claim_text.lower()
         
-        if any(word in text_lower for word in ['health', 'medical', 'vaccine', 'doctor', 'disease']):
+        if matches.has('category_health'):
             facts.append({
                 'type': 'medical_context',
                 'content': 'Medical claims should be verified with peer-reviewed research and official health organizations.',
@@ -531,7 +554,7 @@ class FactChecker:
                 'reliability': 'High'
             })
             
-        elif any(word in text_lower for word in ['climate', 'environment', 'global warming']):
+        elif matches.has('category_environment'):
             facts.append({
                 'type': 'scientific_context',
                 'content': 'Climate science claims should reference peer-reviewed studies and established scientific consensus.',
@@ -539,7 +562,7 @@ class FactChecker:
                 'reliability': 'High'
             })
             
-        elif any(word in text_lower for word in ['election', 'vote', 'politics', 'government']):
+        elif matches.has('category_politics'):
             facts.append({
                 'type': 'political_context',
                 'content': 'Political claims should be verified with official sources and multiple independent fact-checkers.',
@@ -582,13 +605,12 @@ class FactChecker:
         
         return context_facts
     
-    def _generate_factual_content(self, claim_text: str) -> List[Dict[str, Any]]:
+    def _generate_factual_content(self, matches: MatchSet) -> List[Dict[str, Any]]:
         """Generate actual factual content related to the claim"""
         facts = []
-        text_lower = claim_text.lower()
         
         # Water and health claims
-        if 'water' in text_lower and any(word in text_lower for word in ['health', 'disease', 'prevent', 'glasses']):
+        if matches.has('water') and matches.has('water_context'):
             facts.append({
                 'type': 'scientific_fact',
                 'content': 'The human body is approximately 60% water, and adequate hydration is essential for proper bodily functions including temperature regulation, joint lubrication, and nutrient transport.',
@@ -609,7 +631,7 @@ class FactChecker:
             })
         
         # Vaccine-related claims
-        elif any(word in text_lower for word in ['vaccine', 'vaccination']):
+        elif matches.has('vaccine'):
             facts.append({
                 'type': 'medical_fact',
                 'content': 'Vaccines undergo rigorous testing in multiple phases of clinical trials before approval, and continue to be monitored for safety and effectiveness after deployment.',
@@ -624,7 +646,7 @@ class FactChecker:
             })
         
         # Climate-related claims
-        elif any(word in text_lower for word in ['climate', 'global warming', 'temperature']):
+        elif matches.has('climate_topic'):
             facts.append({
                 'type': 'scientific_fact',
                 'content': 'Multiple independent datasets show global average temperatures have risen by approximately 1.1°C (2°F) since the late 19th century, with most warming occurring in the past 40 years.',
@@ -640,13 +662,12 @@ class FactChecker:
         
         return facts
     
-    def _get_corrective_information(self, claim_text: str) -> List[Dict[str, Any]]:
+    def _get_corrective_information(self, matches: MatchSet) -> List[Dict[str, Any]]:
         """Provide corrective information for potentially misleading claims"""
         corrections = []
-        text_lower = claim_text.lower()
         
         # Address absolute claims
-        if any(word in text_lower for word in ['all', 'every', 'never', 'always', 'completely prevent']):
+        if matches.has('absolute_claims'):
             corrections.append({
                 'type': 'correction',
                 'content': 'Be cautious of absolute statements in health and science. Most biological and medical processes are complex and influenced by multiple factors, making absolute claims rarely accurate.',
@@ -655,7 +676,7 @@ class FactChecker:
             })
         
         # Address "new study" claims without specifics
-        if 'new study' in text_lower and not any(word in text_lower for word in ['university', 'journal', 'published']):
+        if matches.has('new_study') and not matches.has('study_attribution'):
             corrections.append({
                 'type': 'verification_tip',
                 'content': 'When evaluating "new study" claims, look for: the research institution, journal name, sample size, peer review status, and whether results have been replicated by independent researchers.',
@@ -664,7 +685,7 @@ class FactChecker:
             })
         
         # Address miracle cure claims
-        if any(word in text_lower for word in ['cure', 'miracle', 'secret', 'doctors don\'t want']):
+        if matches.has('miracle_cure'):
             corrections.append({
                 'type': 'warning',
                 'content': 'Claims about "miracle cures" or "secrets doctors don\'t want you to know" are common in medical misinformation. Legitimate medical breakthroughs are published in peer-reviewed journals and widely reported by reputable medical organizations.',
@@ -674,13 +695,12 @@ class FactChecker:
         
         return corrections
     
-    def _get_authoritative_information(self, claim_text: str) -> List[Dict[str, Any]]:
+    def _get_authoritative_information(self, matches: MatchSet) -> List[Dict[str, Any]]:
         """Provide authoritative information from trusted sources"""
         authoritative_info = []
-        text_lower = claim_text.lower()
         
         # Health claims - provide CDC/WHO guidance
-        if any(word in text_lower for word in ['health', 'medical', 'disease', 'doctor']):
+        if matches.has('health_topic'):
             authoritative_info.append({
                 'type': 'authoritative_guidance',
                 'content': 'For reliable health information, consult healthcare professionals and trusted sources like the CDC, WHO, Mayo Clinic, or peer-reviewed medical journals. Be wary of health claims from non-medical sources.',
@@ -689,7 +709,7 @@ class FactChecker:
             })
         
         # Science claims - provide scientific method guidance
-        elif any(word in text_lower for word in ['study', 'research', 'scientist', 'data']):
+        elif matches.has('science_topic'):
             authoritative_info.append({
                 'type': 'scientific_guidance',
                 'content': 'Reliable scientific information comes from peer-reviewed research, replicated studies, and scientific consensus. Single studies should be evaluated within the broader context of existing research.',
@@ -699,114 +719,23 @@ class FactChecker:
         
         return authoritative_info
     
-    def _generate_factual_news(self, claim_text: str, external_results: Dict, credibility_score: float) -> str:
+    def _generate_factual_news(self, matches: MatchSet, external_results: Dict, credibility_score: float, rules: RulePack) -> str:
         """Generate factual news content about the claim"""
-        text_lower = claim_text.lower()
-        
-        # Water and health claims
-        if 'water' in text_lower and any(word in text_lower for word in ['health', 'disease', 'prevent', 'glasses']):
-            return """According to the Mayo Clinic and National Academies of Sciences, the human body is approximately 60% water and proper hydration is essential for bodily functions including temperature regulation, joint lubrication, and nutrient transport. 
-
-Recent medical research confirms that adequate hydration supports immune function and overall health. However, the CDC emphasizes that no single intervention can prevent all diseases - disease prevention requires multiple factors including genetics, lifestyle, vaccination, and proper medical care.
-
-The National Academies recommend about 15.5 cups (3.7 liters) of fluids daily for men and 11.5 cups (2.7 liters) for women, including water from food and other beverages. While the "8 glasses of water" guideline is commonly cited, actual hydration needs vary based on activity level, climate, and individual health factors."""
-        
-        # Vaccine-related claims
-        elif any(word in text_lower for word in ['vaccine', 'vaccination']):
-            return """The FDA and CDC report that vaccines undergo rigorous testing in multiple phases of clinical trials before approval and continue to be monitored for safety and effectiveness after deployment. 
-
-According to CDC vaccine impact studies, vaccines have prevented an estimated 21 million hospitalizations and 732,000 deaths among children born in the last 20 years in the United States alone.
-
-Current vaccine safety monitoring systems include the Vaccine Adverse Event Reporting System (VAERS), Vaccine Safety Datalink (VSD), and Clinical Immunization Safety Assessment (CISA) project, which continuously track vaccine safety across millions of doses administered."""
-        
-        # Climate-related claims
-        elif any(word in text_lower for word in ['climate', 'global warming', 'temperature']):
-            return """NASA's Goddard Institute for Space Studies reports that multiple independent datasets show global average temperatures have risen by approximately 1.1°C (2°F) since the late 19th century, with most warming occurring in the past 40 years.
-
-Scientific consensus research shows that over 97% of actively publishing climate scientists agree that recent climate change is primarily caused by human activities, based on multiple independent studies.
-
-The Intergovernmental Panel on Climate Change (IPCC), composed of thousands of scientists worldwide, regularly publishes comprehensive assessments of climate science, impacts, and mitigation strategies based on peer-reviewed research."""
-        
-        # Election and politics claims
-        elif any(word in text_lower for word in ['election', 'vote', 'ballot', 'fraud']):
-            return """Election security experts and officials from both major political parties have confirmed that the 2020 U.S. election was conducted securely with multiple verification systems in place.
-
-The Department of Homeland Security called it "the most secure election in American history," while state election officials from both parties certified results after recounts and audits in contested states.
-
-Election security measures include paper ballot backups, signature verification, poll watchers from both parties, post-election audits, and cybersecurity protocols developed in coordination with federal agencies."""
+        factual_news = rules.factual_news(matches)
+        if factual_news is not None:
+            return factual_news
         
-        # Technology and 5G claims
-        elif any(word in text_lower for word in ['5g', 'radiation', 'cell tower', 'wireless']):
-            return """The Federal Communications Commission (FCC) and World Health Organization maintain that 5G technology operates within established safety guidelines for radiofrequency exposure.
-
-Scientific studies by the International Commission on Non-Ionizing Radiation Protection show that 5G frequencies are non-ionizing radiation, similar to radio waves, and operate at power levels well below harmful thresholds.
-
-The FDA states that current safety limits for cell phone radiation are based on extensive research and are designed to provide a substantial margin of safety for all age groups."""
-        
-        # Specific false claims that should be debunked
-        elif any(phrase in text_lower for phrase in ['earth is flat', 'flat earth']):
-            return """Scientific evidence conclusively demonstrates that Earth is spherical (an oblate spheroid). This has been confirmed through:
-
-• Satellite imagery and space missions showing Earth's curvature
-• Ships disappearing hull-first over the horizon due to Earth's curvature
-• Different star constellations visible from different latitudes
-• Time zone differences caused by Earth's rotation
-• Gravity measurements consistent with a spherical mass
-• Photographs from the International Space Station and lunar missions
-
-NASA, ESA, and space agencies worldwide have provided extensive photographic and scientific evidence of Earth's spherical shape."""
-        
-        elif any(phrase in text_lower for phrase in ['covid vaccine contains microchip', 'vaccine microchip', 'bill gates microchip']):
-            return """Medical and technical experts have thoroughly debunked claims about microchips in COVID-19 vaccines. Here are the facts:
-
-• Vaccine ingredients are publicly available and contain mRNA or viral proteins, lipids, salts, and sugars - no electronic components
-• Microchips require power sources and antennas that would be visible and detectable
-• The needle used for vaccination is too small to accommodate any tracking device
-• No credible evidence or documentation supports these claims
-
-The FDA, CDC, and international health organizations have transparently published all vaccine ingredients and manufacturing processes."""
+        # General claims with better accuracy assessment
+        category = external_results.get('category', 'general')
         
-        elif any(phrase in text_lower for phrase in ['drink bleach', 'bleach cure', 'mms cure']):
-            return """WARNING: Drinking bleach or similar disinfectants is extremely dangerous and potentially fatal. Medical authorities strongly warn against this:
-
-• The FDA has issued multiple warnings that these products can cause severe chemical burns to the mouth, throat, and digestive system
-• Poison control centers report serious injuries and deaths from ingesting bleach-based products
-• No legitimate medical evidence supports using bleach as a cure for any disease
-• These substances can cause organ failure, breathing difficulties, and death
-
-For any health concerns, consult licensed medical professionals, not unverified online sources."""
+        # Analyze claim for specific red flags
+        suspicious_patterns = bool(rules.news_suspicious_group) and matches.has(rules.news_suspicious_group)
         
-        # General claims with better accuracy assessment
+        if suspicious_patterns or credibility_score < rules.news_false_below:
+            template = rules.news_templates['likely_false']
+        elif credibility_score >= rules.news_true_from:
+            template = rules.news_templates['likely_true']
         else:
-            category = external_results.get('category', 'general')
-            
-            # Analyze claim for specific red flags
-            suspicious_patterns = any(phrase in text_lower for phrase in [
-                'doctors hate this', 'one weird trick', 'they don\'t want you to know',
-                'big pharma', 'government cover-up', 'secret cure'
-            ])
-            
-            if suspicious_patterns or credibility_score < 3:
-                return f"""This {category}-related claim contains language patterns commonly associated with misinformation and lacks credible supporting evidence.
-
-FACT CHECK RESULT: LIKELY FALSE or MISLEADING
-
-Reliable information on this topic can be found through:
-• Peer-reviewed scientific journals
-• Government health agencies (CDC, FDA, WHO)
-• Academic medical institutions
-• Established fact-checking organizations
-
-Always verify health and scientific claims with qualified professionals and authoritative sources."""
-            elif credibility_score >= 7:
-                return f"""This {category}-related claim is supported by available evidence from reputable sources.
-
-FACT CHECK RESULT: LIKELY TRUE
-
-The information appears consistent with current scientific understanding and authoritative sources. However, continue to verify important claims through multiple reliable sources."""
-            else:
-                return f"""This {category}-related claim has mixed or insufficient evidence for a definitive assessment.
-
-FACT CHECK RESULT: REQUIRES VERIFICATION
-
-Some aspects may be accurate while others need additional verification. Consult multiple authoritative sources and expert opinions before drawing conclusions about this topic."""
+            template = rules.news_templates['requires_verification']
+        
+        return template.format(category=category)
@@ -0,0 +1,193 @@
+import os
+import time
+import random
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional
+
+DEFAULT_FACT_CHECK_URL = 'https://factchecktools.googleapis.com/v1alpha1/claims:search'
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitBreaker:
+    """Stops calling an upstream after repeated failures and probes it again after a cool-down"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """True if a call may go through; in half-open state only one probe is let through"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logging.warning(f"Fact Check API circuit opened after {self.failures} failure(s)")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class FactCheckClient:
+    """Google Fact Check Tools API client with a pooled session, retries and a circuit breaker.
+
+    ``search`` never raises: it returns the decoded response, or None when the
+    upstream is unavailable so callers can fall back to internal analysis.
+    """
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None, backoff: Optional[float] = None,
+                 pool_size: Optional[int] = None, max_concurrency: Optional[int] = None,
+                 breaker: Optional[CircuitBreaker] = None, deadline: Optional[float] = None):
+        env = os.environ
+        self.api_key = api_key
+        self.base_url = base_url or env.get('FACT_CHECK_API_URL', DEFAULT_FACT_CHECK_URL)
+        self.connect_timeout = connect_timeout if connect_timeout is not None else float(env.get('FACT_CHECK_CONNECT_TIMEOUT', 1.05))
+        self.read_timeout = read_timeout if read_timeout is not None else float(env.get('FACT_CHECK_READ_TIMEOUT', 3))
+        # Upper bound on one search() including retries and backoff
+        self.deadline = deadline if deadline is not None else float(env.get('FACT_CHECK_DEADLINE', 4))
+        self.max_retries = max_retries if max_retries is not None else int(env.get('FACT_CHECK_MAX_RETRIES', 2))
+        self.backoff = backoff if backoff is not None else float(env.get('FACT_CHECK_BACKOFF', 0.2))
+        self.pool_size = pool_size or int(env.get('FACT_CHECK_POOL_SIZE', 10))
+        max_concurrency = max_concurrency or int(env.get('FACT_CHECK_MAX_CONCURRENCY', self.pool_size))
+        self.acquire_timeout = float(env.get('FACT_CHECK_ACQUIRE_TIMEOUT', 1))
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=int(env.get('FACT_CHECK_BREAKER_THRESHOLD', 5)),
+            reset_timeout=float(env.get('FACT_CHECK_BREAKER_RESET', 30))
+        )
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._session = None
+        self._session_pid = None
+        self._session_lock = threading.Lock()
+        self.stats = {'requests': 0, 'errors': 0, 'retries': 0, 'short_circuited': 0}
+
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session, recreated after a fork so workers never share sockets"""
+        if self._session is None or self._session_pid != os.getpid():
+            with self._session_lock:
+                if self._session is None or self._session_pid != os.getpid():
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+                    self._session_pid = os.getpid()
+        return self._session
+
+    def search(self, query: str, language_code: str = 'en') -> Optional[Dict[str, Any]]:
+        """Search published fact-checks for a claim"""
+        if not self._semaphore.acquire(timeout=self.acquire_timeout):
+            logging.warning("Fact Check API concurrency limit reached, skipping lookup")
+            self.stats['short_circuited'] += 1
+            return None
+
+        try:
+            if not self.breaker.allow_request():
+                self.stats['short_circuited'] += 1
+                return None
+            try:
+                return self._search_with_retries(query, language_code)
+            except Exception as e:
+                # Every call the breaker let through must report back, or a
+                # half-open probe that raised would keep the circuit shut for good
+                logging.error(f"Unexpected error calling Fact Check API: {str(e)}")
+                self.stats['errors'] += 1
+                self.breaker.record_failure()
+                return None
+        finally:
+            self._semaphore.release()
+
+    def _search_with_retries(self, query: str, language_code: str) -> Optional[Dict[str, Any]]:
+        params = {
+            'key': self.api_key,
+            'query': query,
+            'languageCode': language_code
+        }
+
+        give_up_at = time.monotonic() + self.deadline
+        last_failure_counted = False
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+                # Exponential backoff with full jitter, never past the deadline
+                time.sleep(min(random.uniform(0, self.backoff * (2 ** (attempt - 1))),
+                               max(0.0, give_up_at - time.monotonic())))
+
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                logging.warning(f"Fact Check API deadline of {self.deadline}s reached after {attempt} attempt(s)")
+                break
+
+            self.stats['requests'] += 1
+            try:
+                response = self.session.get(
+                    self.base_url,
+                    params=params,
+                    timeout=(min(self.connect_timeout, remaining), min(self.read_timeout, remaining))
+                )
+            except requests.exceptions.ReadTimeout as e:
+                # The upstream accepted the request and is slow: retrying would only pin the worker longer
+                logging.error(f"Fact Check API read timed out: {str(e)}")
+                self.stats['errors'] += 1
+                self.breaker.record_failure()
+                return None
+            except requests.exceptions.ConnectTimeout as e:
+                logging.error(f"Fact Check API connect timed out: {str(e)}")
+                self.stats['errors'] += 1
+                self.breaker.record_failure()
+                last_failure_counted = True
+                continue
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Error calling Fact Check API: {str(e)}")
+                self.stats['errors'] += 1
+                last_failure_counted = False
+                continue
+
+            if response.status_code == 200:
+                self.breaker.record_success()
+                try:
+                    return response.json()
+                except ValueError as e:
+                    logging.error(f"Invalid Fact Check API response: {str(e)}")
+                    self.stats['errors'] += 1
+                    return None
+
+            self.stats['errors'] += 1
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                # Client errors say nothing about upstream health
+                logging.warning(f"Fact Check API returned status {response.status_code}")
+                self.breaker.record_success()
+                return None
+            logging.warning(f"Fact Check API returned status {response.status_code}, attempt {attempt + 1}")
+            last_failure_counted = False
+
+        # Timed-out attempts were already counted one by one
+        if not last_failure_counted:
+            self.breaker.record_failure()
+        return None
@@ -0,0 +1,50 @@
+"""gunicorn settings: gunicorn -c gunicorn.conf.py main:app
+
+The master applies pending migrations once before any worker starts, and
+each worker is prewarmed (database connection, components, spaCy model,
+one parse) before it accepts requests. With GUNICORN_PRELOAD=1 the app, the
+spaCy model and the rule tables are loaded once in the master and shared
+copy-on-write by the workers.
+"""
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+preload_app = os.environ.get('GUNICORN_PRELOAD', '').lower() in ('1', 'true', 'yes')
+
+
+def on_starting(server):
+    """Migrate with a short-lived engine so the master never holds pooled connections"""
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        return
+    from sqlalchemy import create_engine
+    import migrations
+    engine = create_engine(database_url)
+    try:
+        version = migrations.upgrade_on_startup(engine)
+        if version is not None:
+            server.log.info(f"Schema at version {version}")
+    finally:
+        engine.dispose()
+
+
+def when_ready(server):
+    if preload_app:
+        from startup import preload_for_fork
+        preload_for_fork()
+
+
+def post_fork(server, worker):
+    from startup import mark_process_start, after_fork
+    mark_process_start()
+    after_fork()
+
+
+def post_worker_init(worker):
+    if os.environ.get('STARTUP_PREWARM', '1').lower() in ('0', 'false', 'no'):
+        return
+    from startup import prewarm
+    prewarm()
@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import uuid
+import signal
+import logging
+import argparse
+import multiprocessing
+from datetime import datetime, timedelta
+from typing import Optional
+from app import app, db
+from models import FactCheckJob
+from claim_store import save_claim
+from claim_dedup import canonical_verdict
+from components import registry
+
+
+def submit_job(claim_text: str) -> FactCheckJob:
+    """Queue a claim for background verification"""
+    job = FactCheckJob(id=uuid.uuid4().hex, claim_text=claim_text, status='queued', attempts=0)
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def get_job(job_id: str) -> Optional[FactCheckJob]:
+    return db.session.get(FactCheckJob, job_id)
+
+
+def claim_next_job() -> Optional[FactCheckJob]:
+    """Atomically move the oldest queued job to running; safe across worker processes"""
+    candidates = db.session.query(FactCheckJob.id).filter_by(status='queued') \
+        .order_by(FactCheckJob.created_at).limit(5).all()
+
+    for (job_id,) in candidates:
+        claimed = db.session.query(FactCheckJob).filter_by(id=job_id, status='queued').update({
+            'status': 'running',
+            'started_at': datetime.utcnow(),
+            'attempts': FactCheckJob.attempts + 1
+        }, synchronize_session=False)
+        db.session.commit()
+        if claimed:
+            return get_job(job_id)
+
+    return None
+
+
+def run_job(job: FactCheckJob):
+    """Verify the job's claim, store the claim row and record the outcome on the job"""
+    try:
+        result = canonical_verdict(job.claim_text) or registry.get('fact_checker').verify_claim(job.claim_text)
+        if result.get('status') == 'error':
+            raise RuntimeError(result.get('reasoning', 'Verification failed'))
+
+        # Written through even in write-behind mode: the job records the claim id
+        claim = save_claim(job.claim_text, result, buffered=False)
+        job.claim_id = claim.id
+        job.result = json.dumps(result)
+        job.status = 'done'
+
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f"Fact-check job {job.id} failed: {str(e)}")
+        job.status = 'failed'
+        job.error = str(e)
+
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
+
+
+def requeue_stale_jobs(timeout: float, max_attempts: int = 3) -> int:
+    """Return jobs left running by a crashed worker to the queue.
+
+    A job that has already been started max_attempts times is marked failed
+    instead, so a claim that crashes its worker every time is not retried forever.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+    stale = db.session.query(FactCheckJob).filter(
+        FactCheckJob.status == 'running',
+        FactCheckJob.started_at < cutoff
+    )
+    failed = stale.filter(FactCheckJob.attempts >= max_attempts).update({
+        'status': 'failed',
+        'error': f'Worker stopped during each of {max_attempts} attempts',
+        'finished_at': datetime.utcnow()
+    }, synchronize_session=False)
+    requeued = stale.filter(FactCheckJob.attempts < max_attempts).update(
+        {'status': 'queued'}, synchronize_session=False
+    )
+    db.session.commit()
+    if failed:
+        logging.error(f"Gave up on {failed} fact-check job(s) after {max_attempts} attempts")
+    return requeued
+
+
+def worker_loop(poll_interval: float = 0.5, stale_timeout: float = 300, max_attempts: int = 3):
+    """Process queued jobs until SIGTERM/SIGINT"""
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+    signal.signal(signal.SIGINT, lambda *_: stopping.append(True))
+
+    with app.app_context():
+        # Never reuse database connections inherited from the parent process,
+        # and leave their sockets to the parent rather than closing them
+        db.engine.dispose(close=False)
+        registry.warm(['fact_checker'])
+        logging.info(f"Fact-check job worker {os.getpid()} started")
+
+        last_requeue = 0.0
+        while not stopping:
+            try:
+                if time.monotonic() - last_requeue > stale_timeout:
+                    requeue_stale_jobs(stale_timeout, max_attempts)
+                    last_requeue = time.monotonic()
+
+                job = claim_next_job()
+            except Exception as e:
+                db.session.rollback()
+                logging.error(f"Error polling fact-check jobs: {str(e)}")
+                job = None
+
+            if job is None:
+                time.sleep(poll_interval)
+                continue
+
+            run_job(job)
+            db.session.remove()
+
+        logging.info(f"Fact-check job worker {os.getpid()} stopped")
+
+
+def start_workers(count: int, poll_interval: float = 0.5, stale_timeout: float = 300, max_attempts: int = 3):
+    """Start a pool of worker processes"""
+    processes = []
+    for _ in range(count):
+        process = multiprocessing.Process(target=worker_loop, args=(poll_interval, stale_timeout, max_attempts),
+                                          daemon=True)
+        process.start()
+        processes.append(process)
+    return processes
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run background fact-check job workers')
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('FACT_CHECK_JOB_WORKERS', 2)))
+    parser.add_argument('--poll-interval', type=float, default=float(os.environ.get('FACT_CHECK_JOB_POLL_INTERVAL', 0.5)))
+    parser.add_argument('--stale-timeout', type=float, default=float(os.environ.get('FACT_CHECK_JOB_STALE_TIMEOUT', 300)))
+    parser.add_argument('--max-attempts', type=int, default=int(os.environ.get('FACT_CHECK_JOB_MAX_ATTEMPTS', 3)))
+    args = parser.parse_args()
+
+    import migrations
+    with app.app_context():
+        migrations.upgrade_on_startup(db.engine)
+    workers = start_workers(args.workers, args.poll_interval, args.stale_timeout, args.max_attempts)
+
+    def stop(*_):
+        for worker in workers:
+            worker.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for worker in workers:
+        worker.join()
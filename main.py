@@ -1,4 +1,7 @@
-from app import app
+from app import app, db
 
 if __name__ == '__main__':
+    import migrations
+    with app.app_context():
+        migrations.upgrade_on_startup(db.engine)
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
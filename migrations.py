@@ -0,0 +1,415 @@
+"""Versioned schema migrations.
+
+Each migration is a function of a SQLAlchemy connection registered with
+``@migration``. Migrations describe the schema as it was at their version
+(never the live models), are idempotent against databases created by the old
+``db.create_all()``, and are applied in order by ``upgrade``.
+"""
+import os
+import re
+import struct
+import hashlib
+import logging
+import argparse
+import unicodedata
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import (
+    MetaData, Table, Column, Index, inspect, text,
+    Integer, String, Text, Float, DateTime
+)
+
+MIGRATIONS: List[Tuple[int, str, Callable]] = []
+
+# Arbitrary key for the PostgreSQL advisory lock serialising concurrent upgrades
+ADVISORY_LOCK_KEY = 74201
+
+
+def migration(version: int, description: str):
+    """Register a migration function"""
+    def register(func):
+        MIGRATIONS.append((version, description, func))
+        MIGRATIONS.sort(key=lambda item: item[0])
+        return func
+    return register
+
+
+def _versions_table(metadata: MetaData) -> Table:
+    return Table(
+        'schema_migrations', metadata,
+        Column('version', Integer, primary_key=True),
+        Column('description', String(200)),
+        Column('applied_at', DateTime)
+    )
+
+
+def current_version(connection) -> int:
+    """Highest applied migration version, 0 for an unmanaged database"""
+    if not inspect(connection).has_table('schema_migrations'):
+        return 0
+    return connection.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")).scalar()
+
+
+def upgrade(engine, target: Optional[int] = None) -> int:
+    """Apply pending migrations up to target (default: latest); returns the resulting version"""
+    with engine.connect() as connection:
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {'key': ADVISORY_LOCK_KEY})
+            connection.commit()
+        try:
+            metadata = MetaData()
+            versions = _versions_table(metadata)
+            versions.create(connection, checkfirst=True)
+            connection.commit()
+
+            version = current_version(connection)
+            for migration_version, description, func in MIGRATIONS:
+                if migration_version <= version or (target is not None and migration_version > target):
+                    continue
+                logging.info(f"Applying migration {migration_version}: {description}")
+                func(connection)
+                connection.execute(versions.insert().values(
+                    version=migration_version,
+                    description=description,
+                    applied_at=datetime.utcnow()
+                ))
+                connection.commit()
+                version = migration_version
+
+            return version
+        finally:
+            if connection.dialect.name == 'postgresql':
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': ADVISORY_LOCK_KEY})
+                connection.commit()
+
+
+def _create_index(connection, table: Table, name: str, *columns, unique: bool = False):
+    existing = {index['name'] for index in inspect(connection).get_indexes(table.name)}
+    if name not in existing:
+        Index(name, *[table.c[column] for column in columns], unique=unique).create(connection)
+
+
+def _reflect(connection, name: str) -> Table:
+    return Table(name, MetaData(), autoload_with=connection)
+
+
+@migration(1, 'initial schema')
+def _initial_schema(connection):
+    metadata = MetaData()
+    Table(
+        'claim', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('claim_text', Text, nullable=False),
+        Column('credibility_score', Float),
+        Column('status', String(20)),
+        Column('sources', Text),
+        Column('reasoning', Text),
+        Column('created_at', DateTime),
+        Column('updated_at', DateTime)
+    )
+    Table(
+        'report', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('content_text', Text, nullable=False),
+        Column('content_url', String(500)),
+        Column('reporter_email', String(120)),
+        Column('category', String(50)),
+        Column('priority', String(20)),
+        Column('status', String(20)),
+        Column('notes', Text),
+        Column('created_at', DateTime)
+    )
+    Table(
+        'trend_data', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('category', String(50), nullable=False),
+        Column('claim_count', Integer),
+        Column('false_claim_count', Integer),
+        Column('date_recorded', DateTime)
+    )
+    Table(
+        'geographic_data', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('country', String(100), nullable=False),
+        Column('region', String(100)),
+        Column('city', String(100)),
+        Column('latitude', Float),
+        Column('longitude', Float),
+        Column('claim_count', Integer),
+        Column('false_claim_count', Integer),
+        Column('category', String(50), nullable=False),
+        Column('date_recorded', DateTime)
+    )
+    Table(
+        'fact_check_job', metadata,
+        Column('id', String(32), primary_key=True),
+        Column('claim_text', Text, nullable=False),
+        Column('status', String(20)),
+        Column('result', Text),
+        Column('error', Text),
+        Column('claim_id', Integer),
+        Column('attempts', Integer),
+        Column('created_at', DateTime),
+        Column('started_at', DateTime),
+        Column('finished_at', DateTime),
+        Index('ix_fact_check_job_status_created_at', 'status', 'created_at')
+    )
+    metadata.create_all(connection, checkfirst=True)
+
+
+@migration(2, 'indexes for dashboard, search and trend access paths')
+def _access_path_indexes(connection):
+    claim = _reflect(connection, 'claim')
+    _create_index(connection, claim, 'ix_claim_created_at_id', 'created_at', 'id')
+    _create_index(connection, claim, 'ix_claim_status', 'status')
+    _create_index(connection, claim, 'ix_claim_credibility_score', 'credibility_score')
+
+    report = _reflect(connection, 'report')
+    _create_index(connection, report, 'ix_report_created_at_id', 'created_at', 'id')
+    _create_index(connection, report, 'ix_report_status', 'status')
+
+    geographic = _reflect(connection, 'geographic_data')
+    _create_index(connection, geographic, 'ix_geographic_data_category_date', 'category', 'date_recorded')
+
+    # Merge duplicate daily trend rows left by racing writers before enforcing uniqueness
+    duplicates = connection.execute(text(
+        "SELECT category, date_recorded, MIN(id), SUM(COALESCE(claim_count, 0)), "
+        "SUM(COALESCE(false_claim_count, 0)) FROM trend_data "
+        "GROUP BY category, date_recorded HAVING COUNT(*) > 1"
+    )).fetchall()
+    for category, date_recorded, keep_id, claim_count, false_claim_count in duplicates:
+        connection.execute(text(
+            "UPDATE trend_data SET claim_count = :claims, false_claim_count = :false_claims WHERE id = :id"
+        ), {'claims': claim_count, 'false_claims': false_claim_count, 'id': keep_id})
+        connection.execute(text(
+            "DELETE FROM trend_data WHERE category = :category AND date_recorded = :day AND id != :id"
+        ), {'category': category, 'day': date_recorded, 'id': keep_id})
+
+    trend = _reflect(connection, 'trend_data')
+    _create_index(connection, trend, 'uq_trend_data_category_day', 'category', 'date_recorded', unique=True)
+    _create_index(connection, trend, 'ix_trend_data_date_recorded', 'date_recorded')
+
+
+@migration(3, 'per-status claim counters')
+def _claim_status_counters(connection):
+    metadata = MetaData()
+    counts = Table(
+        'claim_status_count', metadata,
+        Column('status', String(20), primary_key=True),
+        Column('count', Integer, nullable=False)
+    )
+    counts.create(connection, checkfirst=True)
+    connection.execute(text("DELETE FROM claim_status_count"))
+    connection.execute(text(
+        "INSERT INTO claim_status_count (status, count) "
+        "SELECT COALESCE(status, 'pending'), COUNT(*) FROM claim GROUP BY COALESCE(status, 'pending')"
+    ))
+
+
+@migration(4, 'claim category column and full-text search index')
+def _claim_full_text_search(connection):
+    columns = {column['name'] for column in inspect(connection).get_columns('claim')}
+    if 'category' not in columns:
+        connection.execute(text("ALTER TABLE claim ADD COLUMN category VARCHAR(50)"))
+
+    claim = _reflect(connection, 'claim')
+    _create_index(connection, claim, 'ix_claim_category_credibility_score', 'category', 'credibility_score')
+
+    if connection.dialect.name == 'postgresql':
+        if 'search_vector' not in columns:
+            connection.execute(text(
+                "ALTER TABLE claim ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+                "setweight(to_tsvector('english', coalesce(claim_text, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(reasoning, '')), 'B')) STORED"
+            ))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_claim_search_vector ON claim USING GIN (search_vector)"
+        ))
+
+    elif connection.dialect.name == 'sqlite':
+        connection.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS claim_fts USING fts5("
+            "claim_text, reasoning, content='claim', content_rowid='id', tokenize='porter unicode61')"
+        ))
+        connection.execute(text(
+            "CREATE TRIGGER IF NOT EXISTS claim_fts_insert AFTER INSERT ON claim BEGIN "
+            "INSERT INTO claim_fts (rowid, claim_text, reasoning) VALUES (new.id, new.claim_text, new.reasoning); END"
+        ))
+        connection.execute(text(
+            "CREATE TRIGGER IF NOT EXISTS claim_fts_delete AFTER DELETE ON claim BEGIN "
+            "INSERT INTO claim_fts (claim_fts, rowid, claim_text, reasoning) "
+            "VALUES ('delete', old.id, old.claim_text, old.reasoning); END"
+        ))
+        connection.execute(text(
+            "CREATE TRIGGER IF NOT EXISTS claim_fts_update AFTER UPDATE OF claim_text, reasoning ON claim BEGIN "
+            "INSERT INTO claim_fts (claim_fts, rowid, claim_text, reasoning) "
+            "VALUES ('delete', old.id, old.claim_text, old.reasoning); "
+            "INSERT INTO claim_fts (rowid, claim_text, reasoning) VALUES (new.id, new.claim_text, new.reasoning); END"
+        ))
+        connection.execute(text("INSERT INTO claim_fts (claim_fts) VALUES ('rebuild')"))
+
+
+@migration(5, 'structured JSON columns for the verification result')
+def _claim_result_columns(connection):
+    columns = {column['name'] for column in inspect(connection).get_columns('claim')}
+    postgresql = connection.dialect.name == 'postgresql'
+    json_type = 'JSONB' if postgresql else 'JSON'
+
+    if postgresql:
+        # sources held json.dumps() text; convert it in place
+        connection.execute(text(
+            "ALTER TABLE claim ALTER COLUMN sources TYPE JSONB USING "
+            "CASE WHEN sources IS NULL OR btrim(sources) = '' THEN NULL ELSE sources::jsonb END"
+        ))
+    elif connection.dialect.name == 'sqlite':
+        # JSON1 keeps JSON as text, so the existing values only need to be valid
+        connection.execute(text("UPDATE claim SET sources = NULL WHERE sources = '' OR json_valid(sources) = 0"))
+
+    if 'risk_level' not in columns:
+        connection.execute(text("ALTER TABLE claim ADD COLUMN risk_level VARCHAR(10)"))
+    for name in ('analysis_factors', 'real_facts', 'factual_news'):
+        if name not in columns:
+            connection.execute(text(f"ALTER TABLE claim ADD COLUMN {name} {json_type}"))
+
+    if postgresql:
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_claim_sources ON claim USING GIN (sources jsonb_path_ops)"
+        ))
+
+
+# Bucket start expressions for the rollup backfill, matching trend_store.bucket_start
+# (and, on SQLite, the text format SQLAlchemy stores datetimes in)
+_ROLLUP_BUCKETS = {
+    'postgresql': {
+        'hour': "date_trunc('hour', created_at)",
+        'day': "date_trunc('day', created_at)",
+        'week': "date_trunc('week', created_at)"
+    },
+    'sqlite': {
+        'hour': "strftime('%Y-%m-%d %H:00:00.000000', created_at)",
+        'day': "strftime('%Y-%m-%d 00:00:00.000000', created_at)",
+        'week': "strftime('%Y-%m-%d 00:00:00.000000', created_at, 'weekday 0', '-6 days')"
+    }
+}
+
+
+@migration(6, 'claim location columns and time-bucketed trend rollups')
+def _trend_rollups(connection):
+    columns = {column['name'] for column in inspect(connection).get_columns('claim')}
+    for name in ('country', 'region'):
+        if name not in columns:
+            connection.execute(text(f"ALTER TABLE claim ADD COLUMN {name} VARCHAR(100)"))
+
+    metadata = MetaData()
+    rollup = Table(
+        'trend_rollup', metadata,
+        Column('id', Integer, primary_key=True),
+        Column('granularity', String(10), nullable=False),
+        Column('bucket_start', DateTime, nullable=False),
+        Column('category', String(50), nullable=False),
+        Column('country', String(100), nullable=False),
+        Column('region', String(100), nullable=False),
+        Column('claim_count', Integer, nullable=False),
+        Column('false_claim_count', Integer, nullable=False)
+    )
+    rollup.create(connection, checkfirst=True)
+    _create_index(connection, rollup, 'uq_trend_rollup_bucket',
+                  'granularity', 'category', 'country', 'region', 'bucket_start', unique=True)
+    _create_index(connection, rollup, 'ix_trend_rollup_granularity_bucket', 'granularity', 'bucket_start')
+
+    # Backfill the category totals from the claims; earlier claims carry no location
+    buckets = _ROLLUP_BUCKETS.get(connection.dialect.name)
+    if buckets is None:
+        logging.warning(f"No rollup backfill for dialect {connection.dialect.name}; rollups start empty")
+        return
+
+    connection.execute(text("DELETE FROM trend_rollup"))
+    for granularity, bucket in buckets.items():
+        connection.execute(text(
+            "INSERT INTO trend_rollup (granularity, bucket_start, category, country, region, "
+            "claim_count, false_claim_count) "
+            f"SELECT :granularity, {bucket}, COALESCE(category, 'general'), '', '', COUNT(*), "
+            "SUM(CASE WHEN status = 'false' THEN 1 ELSE 0 END) FROM claim "
+            f"WHERE created_at IS NOT NULL GROUP BY {bucket}, COALESCE(category, 'general')"
+        ), {'granularity': granularity})
+
+
+# Fingerprint and LSH band computation as of migration 7, copied from
+# minhash.py so later changes there cannot alter what this migration writes
+_V7_BANDS = 4
+_V7_NUM_HASHES = 16
+_V7_PUNCTUATION_RE = re.compile(r'[^\w\s]+')
+_V7_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _v7_fingerprint_columns(claim_text: str) -> Dict[str, Optional[int]]:
+    text = unicodedata.normalize('NFKC', claim_text).casefold()
+    normalized = _V7_WHITESPACE_RE.sub(' ', _V7_PUNCTUATION_RE.sub(' ', text)).strip()
+    columns = {'fingerprint': hashlib.sha1(f"\0{normalized}".encode('utf-8')).hexdigest()}
+
+    words = normalized.split()
+    features = set(words) | {f"{first} {second}" for first, second in zip(words, words[1:])}
+    if not features:
+        columns.update({f'lsh_band{band}': None for band in range(_V7_BANDS)})
+        return columns
+
+    signature = [(1 << 32) - 1] * _V7_NUM_HASHES
+    for feature in features:
+        values = struct.unpack(f'>{_V7_NUM_HASHES}I',
+                               hashlib.blake2b(feature.encode('utf-8'), digest_size=64).digest())
+        signature = [min(current, value) for current, value in zip(signature, values)]
+    rows_per_band = _V7_NUM_HASHES // _V7_BANDS
+    for band in range(_V7_BANDS):
+        rows = signature[band * rows_per_band:(band + 1) * rows_per_band]
+        digest = hashlib.blake2b(struct.pack(f'>{rows_per_band}I', *rows), digest_size=4).digest()
+        columns[f'lsh_band{band}'] = int.from_bytes(digest, 'big') & 0x7FFFFFFF
+    return columns
+
+
+@migration(7, 'near-duplicate fingerprints and LSH band keys for claims')
+def _claim_fingerprints(connection):
+    columns = {column['name'] for column in inspect(connection).get_columns('claim')}
+    new_columns = [('fingerprint', 'VARCHAR(40)'), ('hit_count', 'INTEGER DEFAULT 1')]
+    new_columns += [(f'lsh_band{band}', 'INTEGER') for band in range(_V7_BANDS)]
+    for name, column_type in new_columns:
+        if name not in columns:
+            connection.execute(text(f"ALTER TABLE claim ADD COLUMN {name} {column_type}"))
+    connection.execute(text("UPDATE claim SET hit_count = 1 WHERE hit_count IS NULL"))
+
+    # Backfill in id order, a batch at a time, before the indexes exist
+    assignments = ', '.join(['fingerprint = :fingerprint'] + [f'lsh_band{band} = :lsh_band{band}' for band in range(_V7_BANDS)])
+    last_id = 0
+    while True:
+        rows = connection.execute(text(
+            "SELECT id, claim_text FROM claim WHERE id > :last_id AND fingerprint IS NULL ORDER BY id LIMIT 1000"
+        ), {'last_id': last_id}).fetchall()
+        if not rows:
+            break
+        connection.execute(text(f"UPDATE claim SET {assignments} WHERE id = :id"), [
+            {'id': row_id, **_v7_fingerprint_columns(claim_text or '')} for row_id, claim_text in rows
+        ])
+        last_id = rows[-1][0]
+
+    claim = _reflect(connection, 'claim')
+    _create_index(connection, claim, 'ix_claim_fingerprint', 'fingerprint')
+    for band in range(_V7_BANDS):
+        _create_index(connection, claim, f'ix_claim_lsh_band{band}', f'lsh_band{band}')
+
+
+def upgrade_on_startup(engine) -> Optional[int]:
+    """Apply pending migrations at process startup unless MIGRATE_ON_STARTUP=0"""
+    if os.environ.get('MIGRATE_ON_STARTUP', '1').lower() in ('0', 'false', 'no'):
+        return None
+    from startup import startup_phase
+    with startup_phase('migrations'):
+        return upgrade(engine)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Apply database schema migrations')
+    parser.add_argument('--target', type=int, default=None, help='Migrate up to this version (default: latest)')
+    args = parser.parse_args()
+
+    from app import app, db
+    with app.app_context():
+        print(f"Schema at version {upgrade(db.engine, args.target)}")
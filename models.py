@@ -1,15 +1,47 @@
+import json
 from app import db
 from datetime import datetime
-from sqlalchemy import Text, DateTime, Float, Integer, String, Boolean
+from sqlalchemy import Text, DateTime, Float, Integer, String, Boolean, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# JSONB on PostgreSQL, JSON (JSON1 text) on SQLite and other dialects
+JSONType = JSON().with_variant(JSONB(), 'postgresql')
 
 class Claim(db.Model):
     """Model for storing claims and their fact-check results"""
+    __table_args__ = (
+        db.Index('ix_claim_created_at_id', 'created_at', 'id'),
+        db.Index('ix_claim_status', 'status'),
+        db.Index('ix_claim_credibility_score', 'credibility_score'),
+        db.Index('ix_claim_category_credibility_score', 'category', 'credibility_score'),
+        db.Index('ix_claim_fingerprint', 'fingerprint'),
+        db.Index('ix_claim_lsh_band0', 'lsh_band0'),
+        db.Index('ix_claim_lsh_band1', 'lsh_band1'),
+        db.Index('ix_claim_lsh_band2', 'lsh_band2'),
+        db.Index('ix_claim_lsh_band3', 'lsh_band3'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     claim_text = db.Column(Text, nullable=False)
     credibility_score = db.Column(Float, default=0.0)
     status = db.Column(String(20), default='pending')  
-    sources = db.Column(Text)  
+    sources = db.Column(JSONType)  # list of source names
     reasoning = db.Column(Text)
+    category = db.Column(String(50))  # e.g., health, politics, environment
+    country = db.Column(String(100))  # where the claim was submitted from, if known
+    region = db.Column(String(100))
+    risk_level = db.Column(String(10))  # low, medium, high
+    analysis_factors = db.Column(JSONType)
+    real_facts = db.Column(JSONType)
+    factual_news = db.Column(JSONType)
+    # Near-duplicate detection (see minhash.py): exact fingerprint of the
+    # normalized text and MinHash LSH band keys
+    fingerprint = db.Column(String(40))
+    lsh_band0 = db.Column(Integer)
+    lsh_band1 = db.Column(Integer)
+    lsh_band2 = db.Column(Integer)
+    lsh_band3 = db.Column(Integer)
+    hit_count = db.Column(Integer, default=1)  # submissions absorbed by this claim, itself included
     created_at = db.Column(DateTime, default=datetime.utcnow)
     updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -19,14 +51,48 @@ class Claim(db.Model):
             'claim_text': self.claim_text,
             'credibility_score': self.credibility_score,
             'status': self.status,
-            'sources': self.sources,
+            'category': self.category,
+            'country': self.country,
+            'region': self.region,
+            'sources': self.sources or [],
             'reasoning': self.reasoning,
+            'risk_level': self.risk_level,
+            'analysis_factors': self.analysis_factors,
+            'real_facts': self.real_facts,
+            'factual_news': self.factual_news,
+            'hit_count': self.hit_count,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+    def to_result(self):
+        """The stored verify_claim result, in the shape FactChecker returns it"""
+        return {
+            'credibility_score': self.credibility_score,
+            'status': self.status,
+            'category': self.category,
+            'sources': self.sources or [],
+            'reasoning': self.reasoning,
+            'factual_news': self.factual_news,
+            'risk_level': self.risk_level,
+            'analysis_factors': self.analysis_factors,
+            'real_facts': self.real_facts
+        }
+
+class ClaimStatusCount(db.Model):
+    """Number of claims per status, maintained in the same transaction as claim writes"""
+    __tablename__ = 'claim_status_count'
+
+    status = db.Column(String(20), primary_key=True)
+    count = db.Column(Integer, nullable=False, default=0)
+
 class Report(db.Model):
     """Model for user-reported suspicious content"""
+    __table_args__ = (
+        db.Index('ix_report_created_at_id', 'created_at', 'id'),
+        db.Index('ix_report_status', 'status'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     content_text = db.Column(Text, nullable=False)
     content_url = db.Column(String(500))
@@ -52,6 +118,11 @@ class Report(db.Model):
 
 class TrendData(db.Model):
     """Model for tracking misinformation trends"""
+    __table_args__ = (
+        db.Index('uq_trend_data_category_day', 'category', 'date_recorded', unique=True),
+        db.Index('ix_trend_data_date_recorded', 'date_recorded'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     category = db.Column(String(50), nullable=False)
     claim_count = db.Column(Integer, default=0)
@@ -68,8 +139,46 @@ class TrendData(db.Model):
             'date_recorded': self.date_recorded.isoformat() if self.date_recorded else None
         }
 
+class TrendRollup(db.Model):
+    """Claim counts per time bucket, category and location.
+
+    Rows with an empty country hold the totals for the category; rows with a
+    country and an empty region hold the country totals.
+    """
+    __tablename__ = 'trend_rollup'
+    __table_args__ = (
+        db.Index('uq_trend_rollup_bucket', 'granularity', 'category', 'country', 'region', 'bucket_start', unique=True),
+        db.Index('ix_trend_rollup_granularity_bucket', 'granularity', 'bucket_start'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    granularity = db.Column(String(10), nullable=False)  # hour, day, week
+    bucket_start = db.Column(DateTime, nullable=False)
+    category = db.Column(String(50), nullable=False)
+    country = db.Column(String(100), nullable=False, default='')
+    region = db.Column(String(100), nullable=False, default='')
+    claim_count = db.Column(Integer, nullable=False, default=0)
+    false_claim_count = db.Column(Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'granularity': self.granularity,
+            'category': self.category,
+            'country': self.country or None,
+            'region': self.region or None,
+            'claim_count': self.claim_count,
+            'false_claim_count': self.false_claim_count,
+            'false_rate': round((self.false_claim_count / max(self.claim_count, 1)) * 100, 2),
+            'date_recorded': self.bucket_start.isoformat() if self.bucket_start else None
+        }
+
 class GeographicData(db.Model):
     """Model for tracking misinformation by geographic location"""
+    __table_args__ = (
+        db.Index('ix_geographic_data_category_date', 'category', 'date_recorded'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     country = db.Column(String(100), nullable=False)
     region = db.Column(String(100))  
@@ -95,3 +204,34 @@ class GeographicData(db.Model):
             'false_rate': round((self.false_claim_count / max(self.claim_count, 1)) * 100, 2),
             'date_recorded': self.date_recorded.isoformat() if self.date_recorded else None
         }
+
+class FactCheckJob(db.Model):
+    """Model for fact-check jobs queued for background workers"""
+    __table_args__ = (
+        db.Index('ix_fact_check_job_status_created_at', 'status', 'created_at'),
+    )
+
+    id = db.Column(String(32), primary_key=True)  # uuid4 hex
+    claim_text = db.Column(Text, nullable=False)
+    status = db.Column(String(20), default='queued')  # queued, running, done, failed
+    result = db.Column(Text)  # JSON-encoded verify_claim result
+    error = db.Column(Text)
+    claim_id = db.Column(Integer)
+    attempts = db.Column(Integer, default=0)
+    created_at = db.Column(DateTime, default=datetime.utcnow)
+    started_at = db.Column(DateTime)
+    finished_at = db.Column(DateTime)
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'claim_text': self.claim_text,
+            'claim_id': self.claim_id,
+            'result': json.loads(self.result) if self.result else None,
+            'error': self.error,
+            'attempts': self.attempts,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
@@ -1,16 +1,120 @@
-import spacy
+import os
+import time
 import logging
-from typing import List, Dict, Any
+import threading
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from components import ensure_registry_construction
+from metrics import time_stage, observe_stage
+from startup import startup_phase
+
+
+# Pipes each facet reads from: keywords need POS tags and lemmas, quality needs POS tags
+FACET_PIPES = {
+    'keywords': ('tagger', 'attribute_ruler', 'lemmatizer'),
+    'quality': ('tagger', 'attribute_ruler')
+}
+
+
+class DocumentAnalysis:
+    """Claims, entities, keywords and quality metrics derived from a single parse"""
+    
+    def __init__(self, processor: 'NLPProcessor', text: str, doc, disabled: Iterable[str] = ()):
+        self.processor = processor
+        self.text = text
+        self.doc = doc
+        self.disabled = frozenset(disabled)
+    
+    def supports(self, facet: str) -> bool:
+        """Whether the pipes this facet needs ran on the parse"""
+        return not self.disabled.intersection(FACET_PIPES.get(facet, ()))
+    
+    def _require(self, facet: str):
+        if not self.supports(facet):
+            missing = ', '.join(sorted(self.disabled.intersection(FACET_PIPES[facet])))
+            raise ValueError(f"Cannot compute {facet} from a parse without {missing}; analyze the text with those pipes enabled")
+    
+    @cached_property
+    def claims(self) -> List[Dict[str, Any]]:
+        """Potential factual claims, one per qualifying sentence"""
+        claims = []
+        
+        for i, sent in enumerate(self.doc.sents):
+            claim_info = self.processor._analyze_sentence_for_claims(sent, i)
+            if claim_info:
+                claims.append(claim_info)
+        
+        if not claims and self.text.strip():
+            claims.append({
+                'text': self.text.strip(),
+                'sentence_index': 0,
+                'confidence': 0.5,
+                'type': 'general_claim',
+                'entities': self.entities(),
+                'has_factual_content': self.processor._has_factual_content(self.text)
+            })
+        
+        return claims
+    
+    def entities(self, span=None) -> List[Dict[str, str]]:
+        """Named entities of the whole document or of a span of it"""
+        return self.processor._extract_entities(span if span is not None else self.doc)
+    
+    @cached_property
+    def quality(self) -> Dict[str, Any]:
+        """Text quality and characteristics"""
+        self._require('quality')
+        doc = self.doc
+        
+        word_count = len([token for token in doc if not token.is_space])
+        sentence_count = len(list(doc.sents))
+        
+        avg_sentence_length = word_count / max(sentence_count, 1)
+        
+        has_proper_nouns = any(token.pos_ == "PROPN" for token in doc)
+        has_numbers = any(token.like_num for token in doc)
+        has_urls = any("http" in token.text.lower() or "www." in token.text.lower() for token in doc)
+        
+        return {
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'avg_sentence_length': round(avg_sentence_length, 2),
+            'has_proper_nouns': has_proper_nouns,
+            'has_numbers': has_numbers,
+            'has_urls': has_urls,
+            'complexity_score': min(avg_sentence_length / 15, 1.0)  
+        }
+    
+    def keywords(self, max_keywords: int = 10) -> List[str]:
+        """Important keywords, lemmatized and de-duplicated in order of appearance"""
+        self._require('keywords')
+        seen = set()
+        unique_keywords = []
+        for token in self.doc:
+            if (not token.is_stop and 
+                not token.is_punct and 
+                not token.is_space and 
+                len(token.text) > 2 and
+                token.pos_ in ['NOUN', 'PROPN', 'ADJ', 'VERB']):
+                keyword = token.lemma_.lower()
+                if keyword not in seen:
+                    seen.add(keyword)
+                    unique_keywords.append(keyword)
+                    if len(unique_keywords) >= max_keywords:
+                        break
+        
+        return unique_keywords
 
 class NLPProcessor:
     """Handles NLP processing for claim extraction and analysis"""
     
     def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logging.warning("spaCy English model not found. Using blank model.")
-            self.nlp = spacy.blank("en")
+        ensure_registry_construction(self)
+        self.model_name = os.environ.get('NLP_MODEL', 'en_core_web_sm')
+        # Pipes the analyses never use are not loaded at all; the parser provides sentences
+        self.excluded_pipes = [name for name in os.environ.get('NLP_EXCLUDE_PIPES', 'senter').split(',') if name]
+        self._nlp = None
+        self._nlp_lock = threading.Lock()
         
         self.claim_indicators = [
             "according to", "study shows", "research indicates", "experts say",
@@ -22,31 +126,88 @@ class NLPProcessor:
             "percent", "%", "million", "billion", "study", "research",
             "survey", "poll", "statistics", "data", "evidence"
         ]
+        
+        # Claim extraction only needs sentence boundaries and entities
+        self.claim_disabled_pipes = ["tagger", "attribute_ruler", "lemmatizer"]
+        self.batch_size = int(os.environ.get('NLP_BATCH_SIZE', 64))
+        self.n_process = int(os.environ.get('NLP_N_PROCESS', 1))
+    
+    @property
+    def nlp(self):
+        """The spaCy pipeline, loaded on first use unless the prewarm hook already did"""
+        if self._nlp is None:
+            self.load()
+        return self._nlp
     
-    def extract_claims(self, text: str) -> List[Dict[str, Any]]:
+    def load(self):
+        """Load the spaCy model once per process; importing spaCy is itself part of the cost"""
+        with self._nlp_lock:
+            if self._nlp is None:
+                with startup_phase('spacy_load'):
+                    import spacy
+                    try:
+                        self._nlp = spacy.load(self.model_name, exclude=self.excluded_pipes)
+                    except OSError:
+                        logging.warning(f"spaCy model '{self.model_name}' not found. Using blank model.")
+                        self._nlp = spacy.blank("en")
+                logging.info(f"spaCy pipeline loaded: {', '.join(self._nlp.pipe_names) or 'blank'}")
+        return self._nlp
+    
+    def analyze(self, text: str, disable: Optional[List[str]] = None) -> DocumentAnalysis:
+        """Parse text once; claims, entities, keywords and quality are derived from the result.
+        
+        Analyses parsed with pipes disabled only support what those pipes do not provide
+        (claims need sentences and entities, not tags or lemmas); asking one for
+        keywords or quality raises ValueError.
+        """
+        disable = [name for name in (disable or []) if name in self.nlp.pipe_names]
+        with time_stage('nlp_parse'):
+            doc = self.nlp(text, disable=disable)
+        return DocumentAnalysis(self, text, doc, disable)
+    
+    def analyze_batch(self, texts: Iterable[str], batch_size: Optional[int] = None,
+                      n_process: Optional[int] = None, disable: Optional[List[str]] = None) -> Iterator[DocumentAnalysis]:
+        """Parse many texts with nlp.pipe, yielding analyses in input order"""
+        texts = list(texts)
+        disable = [name for name in (disable or []) if name in self.nlp.pipe_names]
+        docs = self.nlp.pipe(
+            texts,
+            batch_size=batch_size or self.batch_size,
+            n_process=n_process or self.n_process,
+            disable=disable
+        )
+        # One nlp_parse observation per batch: the time spent waiting on the pipe
+        parse_seconds = 0.0
+        try:
+            for text in texts:
+                started = time.perf_counter()
+                doc = next(docs)
+                parse_seconds += time.perf_counter() - started
+                yield DocumentAnalysis(self, text, doc, disable)
+        finally:
+            if texts:
+                observe_stage('nlp_parse', parse_seconds)
+    
+    def extract_claims_batch(self, texts: Iterable[str], batch_size: Optional[int] = None,
+                             n_process: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """Extract claims from many texts at once, returning one claim list per text in input order"""
+        texts = list(texts)
+        results = []
+        try:
+            for analysis in self.analyze_batch(texts, batch_size, n_process, self.claim_disabled_pipes):
+                results.append(self.extract_claims(analysis.text, analysis))
+        except Exception as e:
+            logging.error(f"Error in batch claim extraction, falling back to single documents: {str(e)}")
+            results.extend(self.extract_claims(text) for text in texts[len(results):])
+        
+        return results
+    
+    def extract_claims(self, text: str, analysis: Optional[DocumentAnalysis] = None) -> List[Dict[str, Any]]:
         """Extract potential factual claims from text"""
         try:
-            doc = self.nlp(text)
-            claims = []
-            
-            sentences = [sent.text.strip() for sent in doc.sents]
-            
-            for i, sentence in enumerate(sentences):
-                claim_info = self._analyze_sentence_for_claims(sentence, i)
-                if claim_info:
-                    claims.append(claim_info)
-            
-            if not claims and text.strip():
-                claims.append({
-                    'text': text.strip(),
-                    'sentence_index': 0,
-                    'confidence': 0.5,
-                    'type': 'general_claim',
-                    'entities': self._extract_entities(text),
-                    'has_factual_content': self._has_factual_content(text)
-                })
-            
-            return claims
+            if analysis is None:
+                analysis = self.analyze(text, self.claim_disabled_pipes)
+            return analysis.claims
             
         except Exception as e:
             logging.error(f"Error in claim extraction: {str(e)}")
@@ -59,8 +220,9 @@ class NLPProcessor:
                 'has_factual_content': False
             }]
     
-    def _analyze_sentence_for_claims(self, sentence: str, index: int) -> Dict[str, Any]:
-        """Analyze a sentence to determine if it contains factual claims"""
+    def _analyze_sentence_for_claims(self, sent, index: int) -> Dict[str, Any]:
+        """Analyze a sentence span to determine if it contains factual claims"""
+        sentence = sent.text.strip()
         sentence_lower = sentence.lower()
         
         has_claim_indicator = any(indicator in sentence_lower for indicator in self.claim_indicators)
@@ -81,11 +243,11 @@ class NLPProcessor:
         
         if confidence >= 0.3:
             return {
-                'text': sentence.strip(),
+                'text': sentence,
                 'sentence_index': index,
                 'confidence': confidence,
                 'type': self._classify_claim_type(sentence),
-                'entities': self._extract_entities(sentence),
+                'entities': self._extract_entities(sent),
                 'has_factual_content': has_factual_content,
                 'has_claim_indicator': has_claim_indicator,
                 'has_numbers': has_numbers
@@ -113,13 +275,14 @@ class NLPProcessor:
         else:
             return 'general_claim'
     
-    def _extract_entities(self, text: str) -> List[Dict[str, str]]:
-        """Extract named entities from text"""
+    def _extract_entities(self, span) -> List[Dict[str, str]]:
+        """Extract named entities from an already parsed Doc or Span"""
+        # Already imported by load() when there is a parse; spaCy is not imported at module level
+        import spacy
         try:
-            doc = self.nlp(text)
             entities = []
             
-            for ent in doc.ents:
+            for ent in span.ents:
                 entities.append({
                     'text': ent.text,
                     'label': ent.label_,
@@ -132,29 +295,13 @@ class NLPProcessor:
             logging.error(f"Error extracting entities: {str(e)}")
             return []
     
-    def analyze_text_quality(self, text: str) -> Dict[str, Any]:
+    def analyze_text_quality(self, text: str, analysis: Optional[DocumentAnalysis] = None) -> Dict[str, Any]:
         """Analyze text quality and characteristics"""
         try:
-            doc = self.nlp(text)
-            
-            word_count = len([token for token in doc if not token.is_space])
-            sentence_count = len(list(doc.sents))
-            
-            avg_sentence_length = word_count / max(sentence_count, 1)
-            
-            has_proper_nouns = any(token.pos_ == "PROPN" for token in doc)
-            has_numbers = any(token.like_num for token in doc)
-            has_urls = any("http" in token.text.lower() or "www." in token.text.lower() for token in doc)
-            
-            return {
-                'word_count': word_count,
-                'sentence_count': sentence_count,
-                'avg_sentence_length': round(avg_sentence_length, 2),
-                'has_proper_nouns': has_proper_nouns,
-                'has_numbers': has_numbers,
-                'has_urls': has_urls,
-                'complexity_score': min(avg_sentence_length / 15, 1.0)  
-            }
+            # An analysis parsed for claim extraction lacks POS tags: parse again in full
+            if analysis is None or not analysis.supports('quality'):
+                analysis = self.analyze(text)
+            return analysis.quality
             
         except Exception as e:
             logging.error(f"Error analyzing text quality: {str(e)}")
@@ -168,28 +315,12 @@ class NLPProcessor:
                 'complexity_score': 0.5
             }
     
-    def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
+    def extract_keywords(self, text: str, max_keywords: int = 10, analysis: Optional[DocumentAnalysis] = None) -> List[str]:
         """Extract important keywords from text"""
         try:
-            doc = self.nlp(text)
-            
-            keywords = []
-            for token in doc:
-                if (not token.is_stop and 
-                    not token.is_punct and 
-                    not token.is_space and 
-                    len(token.text) > 2 and
-                    token.pos_ in ['NOUN', 'PROPN', 'ADJ', 'VERB']):
-                    keywords.append(token.lemma_.lower())
-            
-            seen = set()
-            unique_keywords = []
-            for keyword in keywords:
-                if keyword not in seen:
-                    seen.add(keyword)
-                    unique_keywords.append(keyword)
-            
-            return unique_keywords[:max_keywords]
+            if analysis is None or not analysis.supports('keywords'):
+                analysis = self.analyze(text)
+            return analysis.keywords(max_keywords)
             
         except Exception as e:
             logging.error(f"Error extracting keywords: {str(e)}")
@@ -0,0 +1,265 @@
+"""Opt-in statistical profiler for individual requests and verifications.
+
+A single sampler thread per process wakes every PROFILE_INTERVAL_MS while at
+least one profile is recording, reads the stacks of the profiled threads from
+sys._current_frames() and counts them. Nothing is traced, so a profiled
+request runs at full speed and unprofiled requests pay only for the sampling
+decision. Profiles are written in the collapsed-stack format
+("root;caller;leaf count" per line) that flamegraph.pl and speedscope read.
+"""
+import os
+import re
+import hmac
+import sys
+import time
+import random
+import functools
+import logging
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(tempfile.gettempdir(), 'truthlens_profiles'))
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN', '')
+PROFILE_HEADER = 'X-Profile'
+PROFILE_INTERVAL = float(os.environ.get('PROFILE_INTERVAL_MS', 5)) / 1000
+PROFILE_MIN_DURATION = float(os.environ.get('PROFILE_MIN_DURATION_MS', 0)) / 1000
+PROFILE_MAX_FILES = int(os.environ.get('PROFILE_MAX_FILES', 200))
+MAX_STACK_DEPTH = 128
+
+PROFILE_SUFFIX = '.folded'
+
+_current_profile: ContextVar[Optional['Profile']] = ContextVar('current_profile', default=None)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ':')
+
+
+def collapse_stack(frame) -> str:
+    """Root-first, semicolon-separated function labels of a thread's stack"""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class Profile:
+    """Stack samples of the threads working on one request or verification"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started = time.perf_counter()
+        self.started_at = datetime.utcnow()
+        self.duration = 0.0
+        self.samples = Counter()
+        self.threads: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, thread_id: int):
+        with self._lock:
+            self.threads[thread_id] = self.threads.get(thread_id, 0) + 1
+
+    def detach(self, thread_id: int):
+        with self._lock:
+            remaining = self.threads.get(thread_id, 0) - 1
+            if remaining > 0:
+                self.threads[thread_id] = remaining
+            else:
+                self.threads.pop(thread_id, None)
+
+    def record(self, frames: Dict[int, Any]):
+        with self._lock:
+            thread_ids = list(self.threads)
+        stacks = [collapse_stack(frames[thread_id]) for thread_id in thread_ids if thread_id in frames]
+        with self._lock:
+            self.samples.update(stacks)
+
+    def collapsed(self) -> str:
+        with self._lock:
+            samples = self.samples.most_common()
+        return ''.join(f"{stack} {count}\n" for stack, count in samples)
+
+
+class SamplingProfiler:
+    """Owns the sampler thread and the profiles currently recording"""
+
+    def __init__(self, interval: float = PROFILE_INTERVAL, directory: str = PROFILE_DIR):
+        self.interval = interval
+        self.directory = directory
+        self._active: List[Profile] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._thread_pid = None
+
+    def _ensure_sampler(self):
+        # A forked worker does not inherit the parent's sampler thread
+        if self._thread is None or self._thread_pid != os.getpid() or not self._thread.is_alive():
+            self._thread_pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                active = list(self._active)
+                if not active:
+                    self._wakeup.clear()
+                    continue
+            frames = sys._current_frames()
+            for profile in active:
+                profile.record(frames)
+            del frames
+            time.sleep(self.interval)
+
+    def start(self, label: str) -> Profile:
+        profile = Profile(label)
+        profile.attach(threading.get_ident())
+        with self._lock:
+            self._active.append(profile)
+            self._ensure_sampler()
+        self._wakeup.set()
+        return profile
+
+    def stop(self, profile: Profile, label: Optional[str] = None) -> Optional[str]:
+        """Stop recording and write the profile; returns the file name, if one was written"""
+        profile.duration = time.perf_counter() - profile.started
+        with self._lock:
+            if profile in self._active:
+                self._active.remove(profile)
+        if label:
+            profile.label = label
+        if not profile.samples or profile.duration < PROFILE_MIN_DURATION:
+            return None
+        try:
+            return self._write(profile)
+        except OSError as e:
+            logging.error(f"Could not write profile: {str(e)}")
+            return None
+
+    def _write(self, profile: Profile) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        safe_label = re.sub(r'[^A-Za-z0-9_.-]+', '_', profile.label)[:80]
+        name = (f"{profile.started_at.strftime('%Y%m%dT%H%M%S%f')}-{safe_label}-"
+                f"{int(profile.duration * 1000)}ms-{os.getpid()}{PROFILE_SUFFIX}")
+        with open(os.path.join(self.directory, name), 'w') as f:
+            f.write(profile.collapsed())
+        self._prune()
+        return name
+
+    def _prune(self):
+        names = sorted(name for name in os.listdir(self.directory) if name.endswith(PROFILE_SUFFIX))
+        for name in names[:max(0, len(names) - PROFILE_MAX_FILES)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """Stored profiles, newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if not name.endswith(PROFILE_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            parts = name[:-len(PROFILE_SUFFIX)].split('-')
+            profiles.append({
+                'name': name,
+                'label': '-'.join(parts[1:-2]),
+                'duration_ms': int(parts[-2][:-2]) if len(parts) >= 4 and parts[-2].endswith('ms') else None,
+                'pid': parts[-1],
+                'bytes': stat.st_size,
+                'created_at': datetime.utcfromtimestamp(stat.st_mtime).isoformat()
+            })
+        return profiles
+
+
+profiler = SamplingProfiler()
+
+
+def has_profile_token(value: Optional[str]) -> bool:
+    """Whether value is the configured PROFILE_TOKEN; always False when no token is set"""
+    return bool(value and PROFILE_TOKEN) and hmac.compare_digest(value, PROFILE_TOKEN)
+
+
+def should_profile(header_value: Optional[str] = None) -> bool:
+    """Profile this unit of work: the profiling header carries PROFILE_TOKEN, or it won the sampling draw"""
+    if has_profile_token(header_value):
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def start_profile(label: str):
+    """Start recording the current thread; returns (profile, token) for stop_profile"""
+    profile = profiler.start(label)
+    return profile, _current_profile.set(profile)
+
+
+def stop_profile(profile: Profile, token, label: Optional[str] = None) -> Optional[str]:
+    _current_profile.reset(token)
+    return profiler.stop(profile, label)
+
+
+def bind_profile(func):
+    """Wrap func so the thread that runs it is sampled into the current profile, if any.
+
+    Executor threads do not inherit the submitting context, so work handed
+    to a thread pool is otherwise missing from the profile.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return func
+
+    @functools.wraps(func)
+    def run_sampled(*args, **kwargs):
+        thread_id = threading.get_ident()
+        profile.attach(thread_id)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.detach(thread_id)
+    return run_sampled
+
+
+@contextmanager
+def profile_block(label: str):
+    """Profile a block of work, e.g. one verification.
+
+    Inside a profiled request the block joins the request's profile (also
+    when it runs on another thread that inherited the request's context,
+    as async views do); otherwise it is profiled at PROFILE_SAMPLE_RATE.
+    """
+    current = _current_profile.get()
+    if current is not None:
+        thread_id = threading.get_ident()
+        current.attach(thread_id)
+        try:
+            yield
+        finally:
+            current.detach(thread_id)
+        return
+
+    if not should_profile():
+        yield
+        return
+
+    profile, token = start_profile(label)
+    try:
+        yield
+    finally:
+        stop_profile(profile, token)
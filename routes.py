@@ -1,14 +1,166 @@
-from flask import render_template, request, jsonify, flash, redirect, url_for
+from flask import render_template, request, jsonify, flash, redirect, url_for, Response, stream_with_context, g, abort, send_from_directory
 from app import app, db
-from models import Claim, Report, TrendData, GeographicData
-from fact_checker import FactChecker
-from nlp_processor import NLPProcessor
-import json
+from models import Claim, Report
+from components import registry
+from claim_store import save_claim, save_claims, save_report
+from claim_dedup import canonical_verdict
+from write_buffer import write_buffer
+from db_routing import read_only, pool_stats
+from job_queue import submit_job, get_job
+from stats_service import stats_service
+from search_index import search_claims
+from data_export import keyset_page, stream_export, decode_cursor, EXPORT_FORMATS
+from trend_store import rollup_series, series_totals, latest_daily_trends, GRANULARITIES, DEFAULT_MAX_POINTS
+from metrics import metrics, HTTP_REQUEST_SECONDS
+from startup import startup_report, memory_report
+from profiler import profiler, should_profile, has_profile_token, start_profile, stop_profile, PROFILE_HEADER
+from datetime import datetime, timedelta, timezone
+import os
+import hmac
+import time
+import asyncio
 import logging
+import functools
+import importlib.util
  
-# Initialize component
-fact_checker = FactChecker()
-nlp_processor = NLPProcessor()
+# Shared per-worker engines; routes must never construct their own
+fact_checker = registry.get('fact_checker')
+nlp_processor = registry.get('nlp_processor')
+app.extensions['components'] = registry
+
+def _register_component_metrics():
+    """Expose the counters kept by the cache, API client, write buffer and pools at /metrics"""
+    client = fact_checker.fact_check_client
+    metrics.gauge_callback(
+        'factcheck_api_events_total', 'Fact Check API client requests, errors, retries and short-circuited calls',
+        lambda: {(event,): count for event, count in client.stats.items()}, ['event'], kind='counter'
+    )
+    metrics.gauge_callback(
+        'factcheck_api_circuit_open', 'Whether the Fact Check API circuit breaker is open (1) or half-open (0.5)',
+        lambda: {'closed': 0, 'half_open': 0.5, 'open': 1}.get(client.breaker.state)
+    )
+    
+    cache = fact_checker.verdict_cache
+    if cache is not None:
+        metrics.gauge_callback(
+            'verdict_cache_lookups_total', 'Verdict cache lookups by result',
+            lambda: {('hit',): cache.hits, ('miss',): cache.misses}, ['result'], kind='counter'
+        )
+    
+    if write_buffer is not None:
+        metrics.gauge_callback('write_buffer_depth', 'Rows waiting in the write-behind buffer', write_buffer.depth)
+        metrics.gauge_callback(
+            'write_buffer_flush_failures_total', 'Failed write-behind flushes',
+            lambda: write_buffer.stats['failures'], kind='counter'
+        )
+    
+    def pool_values(field):
+        return lambda: {(engine,): stats[field] for engine, stats in pool_stats(db).items()}
+    for field, documentation in [('checked_out', 'Connections checked out'), ('overflow', 'Overflow connections open'),
+                                 ('size', 'Configured pool size')]:
+        metrics.gauge_callback(f'db_pool_{field}', documentation, pool_values(field), ['engine'])
+    for name, field, documentation in [('checkouts', 'checkouts', 'Connection checkouts'),
+                                       ('timeouts', 'timeouts', 'Checkouts that timed out'),
+                                       ('wait_seconds', 'wait_seconds_total', 'Time spent waiting for a connection')]:
+        metrics.gauge_callback(f'db_pool_{name}_total', documentation, pool_values(field), ['engine'], kind='counter')
+    
+    def memory_values():
+        report = memory_report()
+        kinds = ['rss', 'pss', 'shared', 'private', 'swap', 'peak_rss']
+        return {(kind,): report[f'{kind}_bytes'] for kind in kinds if f'{kind}_bytes' in report}
+    metrics.gauge_callback('process_memory_bytes', 'Resident memory of this worker by kind', memory_values, ['kind'])
+
+_register_component_metrics()
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+    if should_profile(request.headers.get(PROFILE_HEADER)):
+        g.profile = start_profile(f"{request.method} {request.endpoint or 'unmatched'}")
+
+def _stop_request_profile(label=None):
+    profile = g.pop('profile', None)
+    if profile is not None:
+        return stop_profile(*profile, label=label)
+    return None
+
+@app.after_request
+def _observe_request_latency(response):
+    started = g.get('request_started')
+    if started is not None:
+        # Streamed exports are timed until the headers are ready, not the last row
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            endpoint=request.endpoint or 'unmatched', method=request.method, status=response.status_code
+        )
+    profile_name = _stop_request_profile(f"{request.method} {request.endpoint or 'unmatched'} {response.status_code}")
+    if profile_name:
+        response.headers['X-Profile-Name'] = profile_name
+    return response
+
+@app.teardown_request
+def _discard_request_profile(error=None):
+    # Requests that raised never reach after_request
+    _stop_request_profile()
+
+def async_view(view):
+    """Serve a coroutine view natively when Flask's async extra (asgiref) is
+    installed, otherwise run it on a private event loop"""
+    if importlib.util.find_spec('asgiref') is not None:
+        return view
+    
+    @functools.wraps(view)
+    def run_view(*args, **kwargs):
+        return asyncio.run(view(*args, **kwargs))
+    return run_view
+
+def _request_location(data=None):
+    """(country, region) of the submitter, from the request body or the geo headers
+    set by the CDN/proxy (GEO_COUNTRY_HEADER, GEO_REGION_HEADER)"""
+    data = data if isinstance(data, dict) else {}
+    country = data.get('country') or request.headers.get(os.environ.get('GEO_COUNTRY_HEADER', 'CF-IPCountry'))
+    region = data.get('region') or request.headers.get(os.environ.get('GEO_REGION_HEADER', 'X-Geo-Region'))
+    
+    country = country.strip().upper()[:100] if isinstance(country, str) else ''
+    region = region.strip()[:100] if isinstance(region, str) else ''
+    # 'XX' is the CDN's unknown-country code
+    if not country or country == 'XX':
+        return None, None
+    return country, region or None
+
+MAX_TREND_DAYS = 3660
+
+def _parse_utc(value):
+    """ISO 8601 timestamp as a naive UTC datetime; naive input is taken to be UTC already"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        try:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        except OverflowError:
+            raise ValueError(f'{value} is out of range in UTC')
+    return parsed
+
+def _time_range_from_args(default_days):
+    """Parse start/end (ISO 8601) or days (at most MAX_TREND_DAYS) from the query string; raises ValueError"""
+    end = _parse_utc(request.args['end']) if request.args.get('end') else datetime.utcnow()
+    if request.args.get('start'):
+        start = _parse_utc(request.args['start'])
+    else:
+        days = min(max(int(request.args.get('days', default_days)), 1), MAX_TREND_DAYS)
+        try:
+            start = end - timedelta(days=days)
+        except OverflowError:
+            raise ValueError('days reaches before the earliest representable date')
+    if start >= end:
+        raise ValueError('start must be before end')
+    return start, end
+
+def _rollup_args():
+    granularity = request.args.get('granularity', 'auto')
+    if granularity != 'auto' and granularity not in GRANULARITIES:
+        raise ValueError(f'granularity must be auto, {", ".join(GRANULARITIES)}')
+    max_points = min(max(int(request.args.get('max_points', DEFAULT_MAX_POINTS)), 1), 2000)
+    return granularity, max_points
 
 @app.route('/')
 def index():
@@ -30,21 +182,11 @@ def fact_check():
             extracted_claims = nlp_processor.extract_claims(claim_text)
             
             # Get fact-check results
-            results = fact_checker.verify_claim(claim_text)
-            
-            # Save to database
-            claim = Claim(
-                claim_text=claim_text,
-                credibility_score=results.get('credibility_score', 0.0),
-                status=results.get('status', 'pending'),
-                sources=json.dumps(results.get('sources', [])),
-                reasoning=results.get('reasoning', '')
-            )
-            db.session.add(claim)
-            db.session.commit()
+            results = canonical_verdict(claim_text) or fact_checker.verify_claim(claim_text)
             
-            # Update trends
-            update_trend_data(results.get('category', 'general'), results.get('status', 'pending'))
+            # Save to database (trend counters are upserted in the same transaction)
+            country, region = _request_location(request.form)
+            save_claim(claim_text, results, country=country, region=region)
             
             return render_template('fact_check.html', 
                                  claim=claim_text, 
@@ -59,110 +201,69 @@ def fact_check():
     return render_template('fact_check.html')
 
 @app.route('/dashboard')
+@read_only
 def dashboard():
     """Evidence dashboard showing recent claims and statistics"""
     recent_claims = Claim.query.order_by(Claim.created_at.desc()).limit(10).all()
     
-    # Calculate statistics
-    total_claims = Claim.query.count()
-    verified_claims = Claim.query.filter_by(status='verified').count()
-    false_claims = Claim.query.filter_by(status='false').count()
-    mixed_claims = Claim.query.filter_by(status='mixed').count()
-    
-    stats = {
-        'total_claims': total_claims,
-        'verified_claims': verified_claims,
-        'false_claims': false_claims,
-        'mixed_claims': mixed_claims,
-        'accuracy_rate': round((verified_claims / max(total_claims, 1)) * 100, 2)
-    }
+    # Statistics from the materialized per-status counters
+    stats = stats_service.dashboard_stats()
     
     return render_template('dashboard.html', claims=recent_claims, stats=stats)
 
 @app.route('/trends')
+@read_only
 def trends():
     """Trend analysis and misinformation heatmap"""
-    trend_data = TrendData.query.order_by(TrendData.date_recorded.desc()).limit(50).all()
-    
-    # Aggregate data by category
-    category_stats = {}
-    for trend in trend_data:
-        if trend.category not in category_stats:
-            category_stats[trend.category] = {
-                'total_claims': 0,
-                'false_claims': 0,
-                'false_rate': 0
-            }
-        category_stats[trend.category]['total_claims'] += (trend.claim_count or 0)
-        category_stats[trend.category]['false_claims'] += (trend.false_claim_count or 0)
+    trend_data = latest_daily_trends(50)
     
-    # Calculate false rates
-    for category in category_stats:
-        total = category_stats[category]['total_claims']
-        false = category_stats[category]['false_claims']
-        category_stats[category]['false_rate'] = round((false / max(total, 1)) * 100, 2)
+    # Per-category totals for the last 30 days from the daily rollups
+    now = datetime.utcnow()
+    series = rollup_series(now - timedelta(days=30), now, level='category', granularity='day')['series']
+    category_stats = {
+        total['category']: {
+            'total_claims': total['claim_count'],
+            'false_claims': total['false_claim_count'],
+            'false_rate': total['false_rate']
+        }
+        for total in series_totals(series, 'category')
+    }
     
     return render_template('trends.html', trend_data=trend_data, category_stats=category_stats)
 
 @app.route('/search', methods=['GET', 'POST'])
+@read_only
 def search():
     """Fact-check search engine"""
     query = None
     category = None
     credibility = None
+    page = 1
+    has_next = False
     results = []
     
     if request.method == 'POST':
         query = request.form.get('query', '').strip()
         category = request.form.get('category', '')
         credibility = request.form.get('credibility', '')
+        page = max(request.form.get('page', 1, type=int) or 1, 1)
         
         if query:
             try:
-                # Build search query
-                search_query = Claim.query
-                
-                # Text search in claim_text and reasoning
-                search_query = search_query.filter(
-                    db.or_(
-                        Claim.claim_text.ilike(f'%{query}%'),
-                        Claim.reasoning.ilike(f'%{query}%')
-                    )
-                )
-                
-                # Category filter
-                if category:
-                    # Extract category from sources (stored as JSON string)
-                    search_query = search_query.filter(Claim.sources.ilike(f'%{category}%'))
-                
-                # Credibility filter
-                if credibility == 'high':
-                    search_query = search_query.filter(Claim.credibility_score >= 8.0)
-                elif credibility == 'medium':
-                    search_query = search_query.filter(
-                        Claim.credibility_score >= 4.0,
-                        Claim.credibility_score < 8.0
-                    )
-                elif credibility == 'low':
-                    search_query = search_query.filter(Claim.credibility_score < 4.0)
-                
-                # Get results ordered by relevance (credibility score desc)
-                results = search_query.order_by(Claim.credibility_score.desc()).limit(20).all()
+                # Full-text search ordered by relevance, one page at a time
+                results, has_next = search_claims(query, category, credibility, page=page)
                 
                 # Add additional properties for display
                 for result in results:
-                    try:
-                        result.sources_list = json.loads(result.sources) if result.sources else []
-                    except:
-                        result.sources_list = []
+                    result.sources_list = result.sources or []
                     
                     # Determine risk level for display
                     if result.credibility_score >= 7:
-                        result.risk_level = 'low'
+                        result.display_risk_level = 'low'
                     elif result.credibility_score >= 4:
-                        result.risk_level = 'medium'
+                        result.display_risk_level = 'medium'
                     else:
-                        result.risk_level = 'high'
+                        result.display_risk_level = 'high'
                         
             except Exception as e:
                 flash(f'Search error: {str(e)}', 'error')
@@ -171,6 +272,8 @@ def search():
                          query=query, 
                          category=category,
                          credibility=credibility,
+                         page=page,
+                         has_next=has_next,
                          results=results)
 
 @app.route('/social-media-check', methods=['POST'])
@@ -192,26 +295,16 @@ def social_media_check():
             extracted_text = social_content
         
         # Use NLP processor to extract claims
-        nlp_processor = NLPProcessor()
         claims = nlp_processor.extract_claims(extracted_text)
         
         if claims:
             # Fact-check the most significant claim
             main_claim = max(claims, key=lambda x: x.get('confidence', 0))
-            fact_checker = FactChecker()
-            results = fact_checker.verify_claim(main_claim['text'])
+            results = canonical_verdict(main_claim['text']) or fact_checker.verify_claim(main_claim['text'])
             
             # Store the result
-            new_claim = Claim(
-                claim_text=main_claim['text'],
-                credibility_score=results['credibility_score'],
-                status=results['status'],
-                sources=json.dumps(results.get('sources', [])),
-                reasoning=results['reasoning']
-            )
-            
-            db.session.add(new_claim)
-            db.session.commit()
+            country, region = _request_location(request.form)
+            save_claim(main_claim['text'], results, country=country, region=region)
             
             flash(f'Social media content fact-checked! Credibility score: {results["credibility_score"]:.1f}/10', 'success')
             return redirect(url_for('fact_check'))
@@ -238,16 +331,14 @@ def report():
         
         try:
             # Create new report
-            report = Report(
-                content_text=content_text,
-                content_url=content_url if content_url else None,
-                reporter_email=reporter_email if reporter_email else None,
-                category=category,
-                priority='medium',
-                status='pending'
-            )
-            db.session.add(report)
-            db.session.commit()
+            save_report({
+                'content_text': content_text,
+                'content_url': content_url if content_url else None,
+                'reporter_email': reporter_email if reporter_email else None,
+                'category': category,
+                'priority': 'medium',
+                'status': 'pending'
+            })
             
             flash('Thank you for your report. We will review it shortly.', 'success')
             return redirect(url_for('report'))
@@ -261,7 +352,8 @@ def report():
 # API Endpoints
 
 @app.route('/api/fact-check', methods=['POST'])
-def api_fact_check():
+@async_view
+async def api_fact_check():
     """API endpoint for fact-checking claims"""
     try:
         data = request.get_json()
@@ -273,19 +365,12 @@ def api_fact_check():
         if not claim_text:
             return jsonify({'error': 'Missing claim or content text'}), 400
         
-        # Process the claim
-        fact_check_result = fact_checker.verify_claim(claim_text)
+        # Process the claim, overlapping the external lookup with local analysis
+        fact_check_result = canonical_verdict(claim_text) or await fact_checker.verify_claim_async(claim_text)
         
         # Save to database
-        claim = Claim(
-            claim_text=claim_text,
-            credibility_score=fact_check_result.get('credibility_score', 0.0),
-            status=fact_check_result.get('status', 'pending'),
-            sources=json.dumps(fact_check_result.get('sources', [])),
-            reasoning=fact_check_result.get('reasoning', '')
-        )
-        db.session.add(claim)
-        db.session.commit()
+        country, region = _request_location(data)
+        save_claim(claim_text, fact_check_result, country=country, region=region)
         
         # Format response for browser extension compatibility
         return jsonify({
@@ -297,9 +382,110 @@ def api_fact_check():
         logging.error(f"API fact-check error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/fact-check/batch', methods=['POST'])
+def api_fact_check_batch():
+    """API endpoint for fact-checking many claims in one request"""
+    try:
+        data = request.get_json()
+        if not data or not isinstance(data.get('claims'), list):
+            return jsonify({'error': 'Missing claims array'}), 400
+        
+        items = data['claims']
+        max_claims = int(os.environ.get('FACT_CHECK_BATCH_MAX', 100))
+        if len(items) > max_claims:
+            return jsonify({'error': f'Too many claims (maximum {max_claims})'}), 413
+        
+        # Accept plain strings or objects with a client id and 'claim'/'content' text
+        results = []
+        pending = []
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                client_id = item.get('id', index)
+                claim_text = item.get('claim') or item.get('content') or ''
+            else:
+                client_id = index
+                claim_text = item
+            
+            if not isinstance(claim_text, str):
+                results.append({'id': client_id, 'success': False, 'error': 'Claim text must be a string'})
+                continue
+            claim_text = claim_text.strip()
+            if claim_text:
+                results.append({'id': client_id, 'success': True})
+                pending.append((len(results) - 1, claim_text))
+            else:
+                results.append({'id': client_id, 'success': False, 'error': 'Missing claim or content text'})
+        
+        claim_texts = [claim_text for _, claim_text in pending]
+        extracted = nlp_processor.extract_claims_batch(claim_texts)
+        # Repeats of recently verified claims reuse the stored verdict (CLAIM_DEDUP_ANSWER)
+        known = [canonical_verdict(claim_text) for claim_text in claim_texts]
+        fresh = iter(fact_checker.verify_claims([text for text, verdict in zip(claim_texts, known) if verdict is None]))
+        verified = [verdict if verdict is not None else next(fresh) for verdict in known]
+        
+        to_save = []
+        for (position, claim_text), extracted_claims, fact_check_result in zip(pending, extracted, verified):
+            if fact_check_result.get('status') == 'error':
+                results[position].update({'success': False, 'error': fact_check_result.get('reasoning')})
+                continue
+            results[position]['result'] = fact_check_result
+            results[position]['extracted_claims'] = extracted_claims
+            to_save.append((position, claim_text, fact_check_result))
+        
+        # Save every successful result with a single commit (claim_id is null in write-behind mode)
+        country, region = _request_location(data)
+        claims = save_claims([(claim_text, result) for _, claim_text, result in to_save],
+                             country=country, region=region)
+        for (position, _, _), claim in zip(to_save, claims):
+            results[position]['claim_id'] = claim.id
+        
+        failed = sum(1 for result in results if not result['success'])
+        return jsonify({
+            'success': failed == 0,
+            'processed': len(results) - failed,
+            'failed': failed,
+            'results': results
+        })
+        
+    except Exception as e:
+        logging.error(f"API batch fact-check error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/fact-check/jobs', methods=['POST'])
+def api_submit_fact_check_job():
+    """API endpoint to queue a claim for background fact-checking"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Missing request data'}), 400
+        
+        claim_text = (data.get('claim') or data.get('content') or '').strip()
+        if not claim_text:
+            return jsonify({'error': 'Missing claim or content text'}), 400
+        
+        job = submit_job(claim_text)
+        
+        return jsonify({
+            'job_id': job.id,
+            'status': job.status,
+            'poll_url': url_for('api_get_fact_check_job', job_id=job.id)
+        }), 202
+        
+    except Exception as e:
+        logging.error(f"API job submit error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/fact-check/jobs/<job_id>')
+def api_get_fact_check_job(job_id):
+    """API endpoint to poll a queued fact-check job"""
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict())
+
 @app.route('/api/fact-check/<int:claim_id>')
 def api_get_claim(claim_id):
-    """API endpoint to retrieve fact-check results"""
+    """API endpoint to retrieve the stored fact-check report"""
     claim = Claim.query.get_or_404(claim_id)
     return jsonify(claim.to_dict())
 
@@ -311,14 +497,13 @@ def api_report():
         if not data or 'content' not in data:
             return jsonify({'error': 'Missing content text'}), 400
         
-        report = Report(
-            content_text=data['content'],
-            content_url=data.get('url'),
-            reporter_email=data.get('email'),
-            category=data.get('category', 'general')
-        )
-        db.session.add(report)
-        db.session.commit()
+        # report_id is null in write-behind mode, where the row is written later
+        report = save_report({
+            'content_text': data['content'],
+            'content_url': data.get('url'),
+            'reporter_email': data.get('email'),
+            'category': data.get('category', 'general')
+        })
         
         return jsonify({
             'report_id': report.id,
@@ -330,43 +515,175 @@ def api_report():
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/trends')
+@read_only
 def api_trends():
-    """API endpoint for trending misinformation topics"""
-    trends = TrendData.query.order_by(TrendData.date_recorded.desc()).limit(20).all()
-    return jsonify([trend.to_dict() for trend in trends])
+    """API endpoint for trending misinformation topics.
+    
+    Without range parameters returns the latest daily per-category buckets;
+    with start/end/days (and optional category, granularity, max_points)
+    returns a downsampled per-category series from the rollups.
+    """
+    if not any(name in request.args for name in ('start', 'end', 'days', 'granularity')):
+        return jsonify([trend.to_dict() for trend in latest_daily_trends(20)])
+    
+    try:
+        start, end = _time_range_from_args(default_days=30)
+        granularity, max_points = _rollup_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify(rollup_series(start, end, level='category', category=request.args.get('category'),
+                                 granularity=granularity, max_points=max_points))
 
-def update_trend_data(category, status):
-    """Update trend data for analytics"""
+@app.route('/api/geo-trends')
+@read_only
+def api_geo_trends():
+    """API endpoint for misinformation by country or region over a time range (default 90 days)"""
+    level = request.args.get('level', 'country')
+    if level not in ('country', 'region'):
+        return jsonify({'error': 'level must be country or region'}), 400
+    
     try:
-        from datetime import date
-        today = date.today()
-        
-        # Find or create trend record for today and category
-        trend = TrendData.query.filter_by(
-            category=category,
-            date_recorded=today
-        ).first()
-        
-        if not trend:
-            trend = TrendData(category=category, date_recorded=today, claim_count=0, false_claim_count=0)
-            db.session.add(trend)
-        
-        # Update counts
-        if trend.claim_count is None:
-            trend.claim_count = 0
-        if trend.false_claim_count is None:
-            trend.false_claim_count = 0
-            
-        trend.claim_count += 1
-        if status == 'false':
-            trend.false_claim_count += 1
-        
-        db.session.commit()
-        
-    except Exception as e:
-        logging.error(f"Error updating trend data: {str(e)}")
+        start, end = _time_range_from_args(default_days=90)
+        granularity, max_points = _rollup_args()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    country = request.args.get('country')
+    result = rollup_series(start, end, level=level, category=request.args.get('category'),
+                           country=country.upper() if country else None,
+                           granularity=granularity, max_points=max_points)
+    result['totals'] = series_totals(result['series'], level)
+    return jsonify(result)
+
+def _list_rows(model):
+    """Keyset-paginated listing: ?cursor=&limit=&order=desc|asc&status=&category="""
+    try:
+        limit = min(max(int(request.args.get('limit', 100)), 1), 1000)
+        cursor = request.args.get('cursor')
+        if cursor:
+            decode_cursor(cursor)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    filters = {'status': request.args.get('status'), 'category': request.args.get('category')}
+    return jsonify(keyset_page(model, cursor=cursor, limit=limit,
+                               descending=request.args.get('order', 'desc') != 'asc', filters=filters))
+
+def _export_rows(model, name):
+    """Streaming export: ?format=ndjson|csv&since=<cursor>&status=&category="""
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({'error': f'format must be one of {", ".join(EXPORT_FORMATS)}'}), 400
+    since = request.args.get('since')
+    if since:
+        try:
+            decode_cursor(since)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+    
+    filters = {'status': request.args.get('status'), 'category': request.args.get('category')}
+    rows = stream_export(model, export_format, since=since, filters=filters)
+    return Response(stream_with_context(rows), mimetype=EXPORT_FORMATS[export_format], headers={
+        'Content-Disposition': f'attachment; filename={name}.{export_format}'
+    })
+
+@app.route('/api/claims')
+@read_only
+def api_claims():
+    """API endpoint listing stored claims with cursor pagination on (created_at, id)"""
+    return _list_rows(Claim)
+
+@app.route('/api/claims/export')
+@read_only
+def api_export_claims():
+    """API endpoint streaming every stored claim as NDJSON or CSV"""
+    return _export_rows(Claim, 'claims')
+
+def _require_reports_token():
+    """Reports carry reporter emails: only list or export them for holders of REPORTS_EXPORT_TOKEN"""
+    token = os.environ.get('REPORTS_EXPORT_TOKEN', '')
+    supplied = request.headers.get('X-Reports-Token', '')
+    if not (token and supplied and hmac.compare_digest(supplied, token)):
+        abort(404)
+
+@app.route('/api/reports')
+@read_only
+def api_reports():
+    """API endpoint listing user reports with cursor pagination on (created_at, id)"""
+    _require_reports_token()
+    return _list_rows(Report)
+
+@app.route('/api/reports/export')
+@read_only
+def api_export_reports():
+    """API endpoint streaming every user report as NDJSON or CSV"""
+    _require_reports_token()
+    return _export_rows(Report, 'reports')
+
+@app.route('/api/write-buffer')
+def api_write_buffer():
+    """API endpoint reporting write-behind buffer depth and flush statistics"""
+    if write_buffer is None:
+        return jsonify({'enabled': False, 'depth': 0})
+    return jsonify({'enabled': True, **write_buffer.get_stats()})
+
+@app.route('/api/db-pools')
+def api_db_pools():
+    """API endpoint reporting connection pool usage and checkout waits per engine"""
+    return jsonify(pool_stats(db))
+
+@app.route('/api/startup')
+def api_startup():
+    """Startup phase timings of the worker serving this request"""
+    return jsonify(startup_report())
+
+@app.route('/api/memory')
+def api_memory():
+    """Shared and private memory of the worker serving this request"""
+    return jsonify(memory_report())
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus scrape endpoint: stage latencies, request latencies, cache, API client, buffer and pool metrics"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+def _require_profile_token():
+    """Profiles expose code paths and claim timings: only serve them to holders of PROFILE_TOKEN"""
+    if not has_profile_token(request.headers.get(PROFILE_HEADER) or request.args.get('token')):
+        abort(404)
+
+@app.route('/debug/profiles')
+def debug_profiles():
+    """Stored request and verification profiles, newest first"""
+    _require_profile_token()
+    return jsonify({'directory': profiler.directory, 'profiles': profiler.list_profiles()})
+
+@app.route('/debug/profiles/<name>')
+def debug_profile(name):
+    """One profile in collapsed-stack format (load it in speedscope or flamegraph.pl)"""
+    _require_profile_token()
+    return send_from_directory(profiler.directory, name, mimetype='text/plain')
 
+@app.route('/api/rules/reload', methods=['POST'])
+def api_reload_rules():
+    """Reload the rule pack in the worker serving this request, for holders of RULES_RELOAD_TOKEN.
 
+    Every worker also picks up file changes on its own within
+    FACT_CHECK_RULES_RELOAD_INTERVAL seconds; this only skips that wait here.
+    """
+    token = os.environ.get('RULES_RELOAD_TOKEN', '')
+    supplied = request.headers.get('X-Rules-Reload-Token', '')
+    if not (token and supplied and hmac.compare_digest(supplied, token)):
+        abort(404)
+    rules = fact_checker.rules.reload()
+    return jsonify({
+        'version': rules.version,
+        'cache_namespace': rules.cache_namespace,
+        'source': rules.source,
+        'loaded_at': rules.loaded_at,
+        'pid': os.getpid()
+    })
 
 @app.errorhandler(404)
 def not_found(error):
@@ -0,0 +1,99 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class MatchSet:
+    """Phrases matched in a single scan of a text, grouped by rule group"""
+
+    def __init__(self, matches: Dict[str, Set[str]]):
+        self._matches = matches
+
+    def has(self, group: str) -> bool:
+        """True if any phrase of the group occurs in the text"""
+        return group in self._matches
+
+    def has_any(self, *groups: str) -> bool:
+        """True if any phrase of any of the groups occurs in the text"""
+        return any(group in self._matches for group in groups)
+
+    def phrases(self, group: str) -> Set[str]:
+        """Phrases of the group found in the text"""
+        return set(self._matches.get(group, ()))
+
+    def groups(self) -> List[str]:
+        """All rule groups with at least one hit"""
+        return list(self._matches)
+
+    def __contains__(self, group: str) -> bool:
+        return group in self._matches
+
+    def __repr__(self) -> str:
+        return f"MatchSet({self._matches!r})"
+
+
+class RuleEngine:
+    """Aho-Corasick automaton over every phrase of every rule group.
+
+    The automaton is compiled once; ``scan`` lowercases the text and walks it a
+    single time, reporting every (group, phrase) hit including overlapping
+    ones. Matching is plain substring matching, so ``engine.scan(text).has(g)``
+    is equivalent to ``any(p in text.lower() for p in groups[g])``.
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]
+        self.group_names = list(groups)
+        self.phrase_count = 0
+
+        for group, phrases in groups.items():
+            for phrase in phrases:
+                phrase = phrase.lower()
+                if phrase:
+                    self._add_phrase(group, phrase)
+                    self.phrase_count += 1
+
+        self._build_failure_links()
+
+    def _add_phrase(self, group: str, phrase: str):
+        node = 0
+        for char in phrase:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[node][char] = next_node
+            node = next_node
+        self._output[node].append((group, phrase))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def scan(self, text: str) -> MatchSet:
+        """Scan text once and return every matched phrase by rule group"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        matches: Dict[str, Set[str]] = {}
+
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for group, phrase in output[node]:
+                matches.setdefault(group, set()).add(phrase)
+
+        return MatchSet(matches)
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+from rule_engine import RuleEngine, MatchSet
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rules', 'fact_checker_rules.json')
+
+
+class RulePack:
+    """Compiled, immutable view of a versioned fact-checking rule pack"""
+
+    def __init__(self, data: Dict[str, Any], source: str = '<memory>'):
+        self.version = str(data['version'])
+        # Identifies the rules themselves: a reload without a version bump still changes it
+        self.content_hash = hashlib.sha1(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+        self.cache_namespace = f"{self.version}:{self.content_hash[:16]}"
+        self.source = source
+        self.loaded_at = time.time()
+
+        groups = data.get('groups', {})
+        self.engine = RuleEngine(groups)
+
+        credibility = data.get('credibility', {})
+        self.default_score = float(credibility.get('default_score', 5.8))
+        self.score_rules = [
+            (
+                self._compile_condition(rule['when'], groups, rule.get('id')),
+                float(rule['score']),
+                [
+                    (self._compile_condition(refinement['when'], groups, rule.get('id')), float(refinement['score']))
+                    for refinement in rule.get('refinements', [])
+                ]
+            )
+            for rule in credibility.get('rules', [])
+        ]
+
+        status = data.get('status', {})
+        self.always_false_groups = self._compile_condition(status.get('always_false', []), groups, 'status')
+
+        news = data.get('factual_news', {})
+        self.news_rules = [
+            (self._compile_condition(rule['when'], groups, rule.get('id')), rule['text'])
+            for rule in news.get('rules', [])
+        ]
+        fallback = news.get('fallback', {})
+        self.news_suspicious_group = fallback.get('suspicious_group')
+        self.news_false_below = float(fallback.get('false_below', 3))
+        self.news_true_from = float(fallback.get('true_from', 7))
+        self.news_templates = fallback.get('templates', {})
+        for key in ('likely_false', 'likely_true', 'requires_verification'):
+            if key not in self.news_templates:
+                raise ValueError(f"Rule pack is missing factual news template '{key}'")
+
+    @staticmethod
+    def _compile_condition(group_names: List[str], groups: Dict[str, Any], rule_id: Optional[str]) -> Tuple[str, ...]:
+        """Validate that every referenced rule group exists"""
+        for name in group_names:
+            if name not in groups:
+                raise ValueError(f"Rule '{rule_id}' references unknown group '{name}'")
+        return tuple(group_names)
+
+    def scan(self, text: str) -> MatchSet:
+        """Scan a claim once against every rule group of the pack"""
+        return self.engine.scan(text)
+
+    def base_score(self, matches: MatchSet) -> float:
+        """Content-based credibility score from the first matching rule"""
+        for condition, score, refinements in self.score_rules:
+            if all(matches.has(group) for group in condition):
+                for refinement_condition, refinement_score in refinements:
+                    if all(matches.has(group) for group in refinement_condition):
+                        return refinement_score
+                return score
+        return self.default_score
+
+    def is_always_false(self, matches: MatchSet) -> bool:
+        """True if the claim matches a known false claim or misinformation pattern"""
+        return matches.has_any(*self.always_false_groups)
+
+    def factual_news(self, matches: MatchSet) -> Optional[str]:
+        """Canned factual news text for the first matching topic, if any"""
+        for condition, text in self.news_rules:
+            if all(matches.has(group) for group in condition):
+                return text
+        return None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'RulePack':
+        with open(path, encoding='utf-8') as handle:
+            data = json.load(handle)
+        return cls(data, source=path)
+
+
+class RulePackLoader:
+    """Holds the active rule pack and atomically swaps in new versions.
+
+    The rule file is polled for changes at most once per ``reload_interval``
+    seconds. A new pack is fully compiled before it replaces the active one, so
+    in-flight verifications keep using the pack they started with, and a broken
+    file leaves the previous pack in place.
+    """
+
+    def __init__(self, path: Optional[str] = None, reload_interval: Optional[float] = None):
+        self.path = path or os.environ.get('FACT_CHECK_RULES_PATH', DEFAULT_RULES_PATH)
+        if reload_interval is None:
+            reload_interval = float(os.environ.get('FACT_CHECK_RULES_RELOAD_INTERVAL', 5))
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._mtime = os.path.getmtime(self.path)
+        self._pack = RulePack.from_file(self.path)
+        self._last_check = time.monotonic()
+        logging.info(f"Loaded rule pack version {self._pack.version} from {self.path}")
+
+    def current(self) -> RulePack:
+        """Return the active rule pack, picking up file changes if due"""
+        if self.reload_interval >= 0 and time.monotonic() - self._last_check >= self.reload_interval:
+            self._check_for_changes()
+        return self._pack
+
+    def _check_for_changes(self):
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._last_check = time.monotonic()
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError as e:
+                logging.error(f"Rule pack {self.path} is not readable: {str(e)}")
+                return
+            if mtime != self._mtime:
+                self._load(mtime)
+        finally:
+            self._lock.release()
+
+    def reload(self) -> RulePack:
+        """Force a reload of the rule file, keeping the old pack on failure"""
+        with self._lock:
+            self._last_check = time.monotonic()
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError as e:
+                logging.error(f"Rule pack {self.path} is not readable: {str(e)}")
+                return self._pack
+            self._load(mtime)
+        return self._pack
+
+    def _load(self, mtime: float):
+        # Remember the mtime even when the file is rejected so a broken pack is
+        # reported once rather than on every poll.
+        self._mtime = mtime
+        try:
+            pack = RulePack.from_file(self.path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.error(f"Rejected rule pack {self.path}: {str(e)}")
+            return
+        previous_version = self._pack.version
+        self._pack = pack
+        logging.info(f"Reloaded rule pack version {previous_version} -> {pack.version}")
@@ -0,0 +1,80 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import text, table, column
+from app import db
+from models import Claim
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+# External-content FTS5 index over claim.claim_text and claim.reasoning (SQLite only)
+claim_fts = table('claim_fts', column('rowid'))
+
+
+def _fts5_query(query: str) -> str:
+    """Quote every term so user input cannot inject FTS5 query syntax; terms are ANDed"""
+    return ' '.join('"{}"'.format(term.replace('"', '""')) for term in _TERM_RE.findall(query))
+
+
+def _apply_filters(search_query, category: Optional[str], credibility: Optional[str]):
+    if category:
+        search_query = search_query.filter(Claim.category == category)
+
+    if credibility == 'high':
+        search_query = search_query.filter(Claim.credibility_score >= 8.0)
+    elif credibility == 'medium':
+        search_query = search_query.filter(
+            Claim.credibility_score >= 4.0,
+            Claim.credibility_score < 8.0
+        )
+    elif credibility == 'low':
+        search_query = search_query.filter(Claim.credibility_score < 4.0)
+
+    return search_query
+
+
+def search_claims(query: str, category: Optional[str] = None, credibility: Optional[str] = None,
+                  page: int = 1, per_page: int = 20) -> Tuple[List[Claim], bool]:
+    """Full-text search over claim text and reasoning, ordered by relevance.
+
+    Uses a tsvector/GIN index ranked by ts_rank on PostgreSQL and an FTS5 index
+    ranked by BM25 on SQLite. Returns one page of claims and whether another
+    page follows.
+    """
+    page = max(page, 1)
+    offset = (page - 1) * per_page
+    dialect = db.session.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        search_query = Claim.query.filter(
+            text("claim.search_vector @@ websearch_to_tsquery('english', :query)")
+        ).order_by(
+            text("ts_rank(claim.search_vector, websearch_to_tsquery('english', :query)) DESC"),
+            Claim.id.desc()
+        ).params(query=query)
+
+    elif dialect == 'sqlite':
+        match = _fts5_query(query)
+        if not match:
+            return [], False
+        search_query = Claim.query.join(
+            claim_fts, claim_fts.c.rowid == Claim.id
+        ).filter(
+            text("claim_fts MATCH :match")
+        ).order_by(
+            text("bm25(claim_fts)"),
+            Claim.id.desc()
+        ).params(match=match)
+
+    else:
+        search_query = Claim.query.filter(
+            db.or_(
+                Claim.claim_text.ilike(f'%{query}%'),
+                Claim.reasoning.ilike(f'%{query}%')
+            )
+        ).order_by(Claim.credibility_score.desc())
+
+    search_query = _apply_filters(search_query, category, credibility)
+
+    # Fetch one extra row to know whether there is a next page without a COUNT
+    rows = search_query.offset(offset).limit(per_page + 1).all()
+    return rows[:per_page], len(rows) > per_page
@@ -0,0 +1,175 @@
+"""Startup phase timings, the worker prewarm hook and the master preload.
+
+Phases (app setup, route import, migrations, database connect, component
+construction, spaCy load, first parse) are timed as they happen; once a
+worker is warm the report is logged and served at /api/startup. With
+GUNICORN_PRELOAD the model and rule tables are loaded once in the master and
+shared copy-on-write by the forked workers; memory_report shows how much of
+each worker's memory is still shared.
+"""
+import gc
+import os
+import sys
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any
+
+WARMUP_TEXT = 'A new study shows that 40 percent of voters in Texas changed their minds.'
+
+_phases: Dict[str, float] = {}
+_lock = threading.Lock()
+_process = {'started': time.perf_counter(), 'ready': None}
+
+
+def mark_process_start():
+    """Start a fresh report in a forked worker; the phases so far belong to the parent"""
+    with _lock:
+        _phases.clear()
+        _process.update(started=time.perf_counter(), ready=None)
+
+
+def record_phase(name: str, seconds: float):
+    with _lock:
+        _phases[name] = _phases.get(name, 0.0) + seconds
+
+
+@contextmanager
+def startup_phase(name: str):
+    """Time a block of startup work under name"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - started)
+
+
+def startup_report() -> Dict[str, Any]:
+    """Phase timings of this process and how long it took to become ready"""
+    with _lock:
+        phases = {name: round(seconds * 1000, 1) for name, seconds in _phases.items()}
+        ready = _process['ready']
+        started = _process['started']
+    return {
+        'pid': os.getpid(),
+        'phases_ms': phases,
+        'ready': ready is not None,
+        'ready_after_ms': round((ready - started) * 1000, 1) if ready is not None else None
+    }
+
+
+def memory_report() -> Dict[str, Any]:
+    """Resident memory of this process split into shared and private pages.
+
+    Read from /proc/self/smaps_rollup (Linux 4.14+). Pss charges each shared
+    page to its sharers proportionally, so summing pss over the workers gives
+    their real footprint; elsewhere only the peak RSS is available.
+    """
+    fields = {'Rss': 'rss_bytes', 'Pss': 'pss_bytes', 'Shared_Clean': 'shared_clean_bytes',
+              'Shared_Dirty': 'shared_dirty_bytes', 'Private_Clean': 'private_clean_bytes',
+              'Private_Dirty': 'private_dirty_bytes', 'Swap': 'swap_bytes'}
+    report = {'pid': os.getpid()}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name in fields:
+                    report[fields[name]] = int(value.split()[0]) * 1024
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        report['peak_rss_bytes'] = peak if sys.platform == 'darwin' else peak * 1024
+        return report
+
+    report['shared_bytes'] = report.get('shared_clean_bytes', 0) + report.get('shared_dirty_bytes', 0)
+    report['private_bytes'] = report.get('private_clean_bytes', 0) + report.get('private_dirty_bytes', 0)
+    return report
+
+
+def _format_memory(report: Dict[str, Any]) -> str:
+    if 'rss_bytes' not in report:
+        return f"peak rss {report['peak_rss_bytes'] / 2**20:.0f} MB"
+    return (f"rss {report['rss_bytes'] / 2**20:.0f} MB, pss {report['pss_bytes'] / 2**20:.0f} MB, "
+            f"shared {report['shared_bytes'] / 2**20:.0f} MB, private {report['private_bytes'] / 2**20:.0f} MB")
+
+
+def mark_ready() -> Dict[str, Any]:
+    """Record that this process can serve requests and log the startup and memory report"""
+    with _lock:
+        if _process['ready'] is None:
+            _process['ready'] = time.perf_counter()
+    report = startup_report()
+    phases = ', '.join(f"{name} {ms:.0f} ms" for name, ms in report['phases_ms'].items())
+    logging.info(f"Worker {report['pid']} ready after {report['ready_after_ms']:.0f} ms ({phases}); "
+                 f"{_format_memory(memory_report())}")
+    return report
+
+
+def _warm_components() -> Dict[str, Any]:
+    from components import registry
+    with startup_phase('components'):
+        components = registry.warm()
+    nlp_processor = components['nlp_processor']
+    nlp_processor.load()
+    with startup_phase('first_parse'):
+        nlp_processor.analyze(WARMUP_TEXT).keywords()
+        # Builds the rule pack's matcher tables
+        components['fact_checker'].rules.current().scan(WARMUP_TEXT)
+    return components
+
+
+def preload_for_fork():
+    """Load the spaCy model and rule tables in the gunicorn master, before workers fork.
+
+    The workers then share those pages copy-on-write. gc.freeze() moves every
+    object allocated so far to a permanent generation that the collector
+    never traverses, so collections in the workers do not touch (and copy)
+    the shared pages. The master's database connections are closed so no
+    socket is shared between workers.
+    """
+    from app import app, db
+
+    with app.app_context():
+        _warm_components()
+        for engine in db.engines.values():
+            engine.dispose()
+
+    gc.collect()
+    gc.freeze()
+    logging.info(f"Preloaded {gc.get_freeze_count()} objects in the master; {_format_memory(memory_report())}")
+
+
+def after_fork():
+    """Drop the database pools a preloading master created, without closing its sockets"""
+    if 'app' not in sys.modules:
+        return
+    from app import app, db
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def prewarm() -> Dict[str, Any]:
+    """Do the work the first request would otherwise pay for.
+
+    Opens a pooled database connection, builds the shared components, loads
+    the spaCy model and runs one parse. Called from the gunicorn
+    post_worker_init hook, so a new worker is warm before it accepts traffic.
+    """
+    from sqlalchemy import text
+    from app import app, db
+
+    with app.app_context():
+        try:
+            with startup_phase('db_connect'):
+                db.session.execute(text('SELECT 1'))
+        except Exception as e:
+            logging.warning(f"Prewarm could not reach the database: {str(e)}")
+        finally:
+            db.session.remove()
+
+        _warm_components()
+
+    return mark_ready()
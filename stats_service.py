@@ -0,0 +1,108 @@
+import os
+import time
+import threading
+from collections import Counter
+from typing import Dict, Any, Iterable, Optional
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+from app import db
+from models import Claim, ClaimStatusCount
+from db_utils import increment_counter
+
+
+def record_status_changes(connection, changes: Dict[str, int]):
+    """Apply per-status count deltas in the caller's transaction"""
+    table = ClaimStatusCount.__table__
+    for status, delta in changes.items():
+        if delta:
+            increment_counter(connection, table, {'status': status}, {'count': delta})
+
+
+def record_new_claims(connection, statuses: Iterable[Optional[str]]):
+    """Count newly inserted claims by status"""
+    record_status_changes(connection, Counter(status or 'pending' for status in statuses))
+
+
+@event.listens_for(Session, 'after_flush')
+def _count_inserted_claims(session, flush_context):
+    # One upsert per status for all the claims a flush inserted
+    statuses = [target.status for target in session.new if isinstance(target, Claim)]
+    if statuses:
+        record_new_claims(session.connection(), statuses)
+
+
+@event.listens_for(Claim, 'after_update')
+def _count_updated_claim(mapper, connection, target):
+    history = inspect(target).attrs.status.history
+    if history.has_changes() and history.deleted:
+        previous = history.deleted[0] or 'pending'
+        current = target.status or 'pending'
+        if previous != current:
+            record_status_changes(connection, {previous: -1, current: 1})
+
+
+@event.listens_for(Claim, 'after_delete')
+def _count_deleted_claim(mapper, connection, target):
+    record_status_changes(connection, {target.status or 'pending': -1})
+
+
+class StatsService:
+    """Dashboard statistics served from the materialized per-status counters"""
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._cached = None
+        self._cached_at = 0.0
+        self._lock = threading.Lock()
+
+    def status_counts(self) -> Dict[str, int]:
+        """Claims per status; reads a handful of counter rows regardless of table size"""
+        if self.ttl > 0:
+            with self._lock:
+                if self._cached is not None and time.monotonic() - self._cached_at < self.ttl:
+                    return dict(self._cached)
+
+        counts = {row.status: row.count for row in ClaimStatusCount.query.all()}
+
+        if self.ttl > 0:
+            with self._lock:
+                self._cached = counts
+                self._cached_at = time.monotonic()
+        return dict(counts)
+
+    def grouped_status_counts(self) -> Dict[str, int]:
+        """Claims per status computed from the claim table in one grouped query"""
+        rows = db.session.query(Claim.status, func.count(Claim.id)).group_by(Claim.status).all()
+        counts = Counter()
+        for status, count in rows:
+            counts[status or 'pending'] += count
+        return dict(counts)
+
+    def recompute(self) -> Dict[str, int]:
+        """Rebuild the counters from the claim table, e.g. after manual data fixes"""
+        counts = self.grouped_status_counts()
+        ClaimStatusCount.query.delete()
+        db.session.add_all([ClaimStatusCount(status=status, count=count) for status, count in counts.items()])
+        db.session.commit()
+        self.invalidate()
+        return counts
+
+    def invalidate(self):
+        with self._lock:
+            self._cached = None
+
+    def dashboard_stats(self) -> Dict[str, Any]:
+        counts = self.status_counts()
+        total_claims = sum(counts.values())
+        verified_claims = counts.get('verified', 0)
+
+        return {
+            'total_claims': total_claims,
+            'verified_claims': verified_claims,
+            'false_claims': counts.get('false', 0),
+            'mixed_claims': counts.get('mixed', 0),
+            'accuracy_rate': round((verified_claims / max(total_claims, 1)) * 100, 2)
+        }
+
+
+stats_service = StatsService(ttl=float(os.environ.get('DASHBOARD_STATS_TTL', 5)))
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from verdict_cache import claim_fingerprint
+
+
+@pytest.fixture
+def fact_checker(monkeypatch):
+    pytest.importorskip('requests')
+    monkeypatch.setenv('VERDICT_CACHE_BACKEND', 'none')
+    monkeypatch.delenv('GOOGLE_FACT_CHECK_API_KEY', raising=False)
+    from fact_checker import FactChecker
+    return FactChecker()
+
+
+@pytest.mark.parametrize('first, second', [
+    ('government cover-up', 'government cover up'),
+    ('www.cdc.gov', 'www cdc gov'),
+])
+def test_punctuation_variants_get_separate_keys(first, second):
+    assert claim_fingerprint(first) != claim_fingerprint(second)
+
+
+@pytest.mark.parametrize('first, second', [
+    ('SHOCKING: Government cover-up exposed', 'shocking:  government cover-up exposed '),
+    ('See www.CDC.gov for details', 'see www.cdc.gov\tfor details'),
+    ('Drinking 10 glasses of water a day cures everything', 'DRINKING 10 GLASSES OF WATER A DAY CURES EVERYTHING'),
+    ('Ｔｈｅ election was rigged', 'the election was rigged'),
+])
+def test_colliding_keys_give_identical_verdicts(fact_checker, first, second):
+    assert claim_fingerprint(first) == claim_fingerprint(second)
+    assert fact_checker.verify_claim(first) == fact_checker.verify_claim(second)
@@ -0,0 +1,216 @@
+import math
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Iterable, Optional
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from app import db
+from models import Claim, TrendRollup
+from db_utils import increment_counter
+from metrics import time_stage
+
+GRANULARITIES = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1)
+}
+
+# Rollup levels: which location columns a series is grouped by
+LEVELS = {
+    'category': ('category',),
+    'country': ('country',),
+    'region': ('country', 'region')
+}
+
+DEFAULT_MAX_POINTS = 200
+
+
+def trend_day(when: Optional[datetime] = None) -> datetime:
+    """Midnight (UTC) of the day a claim is counted under"""
+    when = when or datetime.utcnow()
+    return datetime(when.year, when.month, when.day)
+
+
+def bucket_start(when: datetime, granularity: str) -> datetime:
+    """Start of the hour, day or (Monday-based) week containing when"""
+    if granularity == 'hour':
+        return datetime(when.year, when.month, when.day, when.hour)
+    day = trend_day(when)
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def record_trends(connection, claims: Iterable[Dict[str, Any]]):
+    """Add claims (category, status, created_at, country, region) to the trend counters.
+
+    Updates the hourly, daily and weekly rollups for the category, the
+    country and the region. The legacy trend_data table is no longer written:
+    every trend view reads trend_rollup. Each counter row is upserted
+    once with the summed increments, in the caller's transaction, so
+    concurrent writers neither lose counts nor create duplicate rows.
+    """
+    with time_stage('trend_update'):
+        _record_trends(connection, claims)
+
+
+def _record_trends(connection, claims: Iterable[Dict[str, Any]]):
+    rollups = Counter()
+    rollups_false = Counter()
+
+    for claim in claims:
+        category = claim.get('category') or 'general'
+        created_at = claim.get('created_at') or datetime.utcnow()
+        is_false = 1 if claim.get('status') == 'false' else 0
+
+        country = claim.get('country') or ''
+        region = (claim.get('region') or '') if country else ''
+        locations = [('', '')]
+        if country:
+            locations.append((country, ''))
+        if region:
+            locations.append((country, region))
+
+        for granularity in GRANULARITIES:
+            start = bucket_start(created_at, granularity)
+            for location in locations:
+                key = (granularity, category) + location + (start,)
+                rollups[key] += 1
+                rollups_false[key] += is_false
+
+    table = TrendRollup.__table__
+    for key, claim_count in rollups.items():
+        granularity, category, country, region, start = key
+        increment_counter(
+            connection, table,
+            {'granularity': granularity, 'category': category, 'country': country,
+             'region': region, 'bucket_start': start},
+            {'claim_count': claim_count, 'false_claim_count': rollups_false[key]}
+        )
+
+
+@event.listens_for(Session, 'after_flush')
+def _count_claim_trends(session, flush_context):
+    # session.new still holds the rows this flush inserted; one call per
+    # flush sums them, so a batch of claims upserts each counter once
+    claims = [{
+        'category': target.category,
+        'status': target.status,
+        'created_at': target.created_at,
+        'country': target.country,
+        'region': target.region
+    } for target in session.new if isinstance(target, Claim)]
+    if claims:
+        record_trends(session.connection(), claims)
+
+
+def choose_granularity(start: datetime, end: datetime, max_points: int) -> str:
+    """Finest granularity that covers the range in at most max_points buckets"""
+    for granularity, width in GRANULARITIES.items():
+        if (end - start) / width <= max_points:
+            return granularity
+    return 'week'
+
+
+def rollup_series(start: datetime, end: datetime, level: str = 'category', category: Optional[str] = None,
+                  country: Optional[str] = None, granularity: str = 'auto',
+                  max_points: int = DEFAULT_MAX_POINTS) -> Dict[str, Any]:
+    """Claim counts per bucket in [start, end), read from the precomputed rollups.
+
+    level selects the series: one per category, per country or per region.
+    With granularity 'auto' the finest bucket width giving at most max_points
+    buckets is used; when even weekly buckets exceed max_points, adjacent
+    buckets are merged so the range still fits.
+    """
+    if level not in LEVELS:
+        raise ValueError(f"Unknown rollup level: {level}")
+    if granularity == 'auto':
+        granularity = choose_granularity(start, end, max_points)
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity: {granularity}")
+
+    width = GRANULARITIES[granularity]
+    first_bucket = bucket_start(start, granularity)
+    factor = max(1, math.ceil(((end - first_bucket) / width) / max_points))
+
+    keys = [getattr(TrendRollup, column) for column in LEVELS[level]]
+    query = db.session.query(
+        TrendRollup.bucket_start, *keys,
+        func.sum(TrendRollup.claim_count), func.sum(TrendRollup.false_claim_count)
+    ).filter(
+        TrendRollup.granularity == granularity,
+        TrendRollup.bucket_start >= first_bucket,
+        TrendRollup.bucket_start < end
+    )
+
+    if level == 'category':
+        query = query.filter(TrendRollup.country == '')
+    elif level == 'country':
+        query = query.filter(TrendRollup.country != '', TrendRollup.region == '')
+    else:
+        query = query.filter(TrendRollup.region != '')
+    if category:
+        query = query.filter(TrendRollup.category == category)
+    if country:
+        query = query.filter(TrendRollup.country == country)
+
+    rows = query.group_by(TrendRollup.bucket_start, *keys).order_by(TrendRollup.bucket_start).all()
+
+    # Merge every `factor` adjacent buckets (a no-op when factor is 1)
+    merged_counts = Counter()
+    merged_false = Counter()
+    for row in rows:
+        index = (row[0] - first_bucket) // (width * factor)
+        key = (first_bucket + index * width * factor,) + tuple(row[1:-2])
+        merged_counts[key] += row[-2] or 0
+        merged_false[key] += row[-1] or 0
+
+    series = []
+    for key in sorted(merged_counts):
+        claim_count = merged_counts[key]
+        point = {'bucket_start': key[0].isoformat()}
+        point.update(zip(LEVELS[level], key[1:]))
+        point.update({
+            'claim_count': claim_count,
+            'false_claim_count': merged_false[key],
+            'false_rate': round((merged_false[key] / max(claim_count, 1)) * 100, 2)
+        })
+        series.append(point)
+
+    return {
+        'level': level,
+        'granularity': granularity,
+        'bucket_seconds': int((width * factor).total_seconds()),
+        'start': first_bucket.isoformat(),
+        'end': end.isoformat(),
+        'series': series
+    }
+
+
+def series_totals(series: List[Dict[str, Any]], level: str) -> List[Dict[str, Any]]:
+    """Collapse a rollup series over time, e.g. for a heatmap of the whole range"""
+    counts = Counter()
+    false_counts = Counter()
+    for point in series:
+        key = tuple(point[column] for column in LEVELS[level])
+        counts[key] += point['claim_count']
+        false_counts[key] += point['false_claim_count']
+
+    totals = []
+    for key, claim_count in counts.most_common():
+        total = dict(zip(LEVELS[level], key))
+        total.update({
+            'claim_count': claim_count,
+            'false_claim_count': false_counts[key],
+            'false_rate': round((false_counts[key] / max(claim_count, 1)) * 100, 2)
+        })
+        totals.append(total)
+    return totals
+
+
+def latest_daily_trends(limit: int = 20) -> List[TrendRollup]:
+    """Most recent daily per-category rollups"""
+    return TrendRollup.query.filter(
+        TrendRollup.granularity == 'day',
+        TrendRollup.country == ''
+    ).order_by(TrendRollup.bucket_start.desc(), TrendRollup.category).limit(limit).all()
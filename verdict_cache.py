@@ -0,0 +1,213 @@
+import os
+import re
+import copy
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_claim(claim_text: str) -> str:
+    """Fold Unicode forms, case and whitespace; the text a claim is verified and cached under.
+
+    Punctuation is kept: rules match raw substrings, so "cover-up" and
+    "cover up" can score differently and must not share a cache entry.
+    """
+    text = unicodedata.normalize('NFKC', claim_text).casefold()
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def claim_fingerprint(claim_text: str, namespace: str = '') -> str:
+    """Stable cache key for a claim, scoped by namespace (e.g. the rule pack's cache_namespace)"""
+    normalized = normalize_claim(claim_text)
+    return hashlib.sha1(f"{namespace}\0{normalized}".encode('utf-8')).hexdigest()
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry expiry"""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float):
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """Approximate-LRU cache in a local SQLite file shared by every worker process on the host.
+
+    A hit only refreshes accessed_at when it is older than touch_interval
+    seconds, so reads of hot entries stay reads instead of queueing for
+    SQLite's single writer.
+    """
+
+    EVICT_EVERY = 64
+
+    def __init__(self, path: str, max_size: int = 100000, touch_interval: float = 60):
+        self.path = path
+        self.max_size = max_size
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS verdict_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_verdict_cache_accessed_at ON verdict_cache (accessed_at)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_verdict_cache_expires_at ON verdict_cache (expires_at)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork or be shared between threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT value, expires_at, accessed_at FROM verdict_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if row[1] < now:
+            # Left for the periodic eviction: deleting here would turn a miss into a write
+            return None
+        if now - row[2] >= self.touch_interval:
+            connection.execute("UPDATE verdict_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float):
+        connection = self._connection()
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO verdict_cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now + ttl, now)
+        )
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            self._evict(connection, now)
+
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        # Both deletes walk an index to the rows they remove instead of
+        # sorting the table while holding the write lock
+        connection.execute("DELETE FROM verdict_cache WHERE expires_at < ?", (now,))
+        connection.execute(
+            "DELETE FROM verdict_cache WHERE accessed_at < "
+            "(SELECT accessed_at FROM verdict_cache ORDER BY accessed_at DESC LIMIT 1 OFFSET ?)",
+            (self.max_size - 1,)
+        )
+
+    def clear(self):
+        self._connection().execute("DELETE FROM verdict_cache")
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM verdict_cache").fetchone()[0]
+
+
+class VerdictCache:
+    """Caches verify_claim results by normalized claim fingerprint"""
+
+    def __init__(self, backend, ttl: float = 3600):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, claim_text: str, namespace: str = '') -> Optional[Dict[str, Any]]:
+        try:
+            result = self.backend.get(claim_fingerprint(claim_text, namespace))
+        except Exception as e:
+            logging.error(f"Error reading verdict cache: {str(e)}")
+            result = None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def set(self, claim_text: str, result: Dict[str, Any], namespace: str = ''):
+        try:
+            self.backend.set(claim_fingerprint(claim_text, namespace), result, self.ttl)
+        except Exception as e:
+            logging.error(f"Error writing verdict cache: {str(e)}")
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'ttl': self.ttl
+        }
+
+
+def create_verdict_cache() -> Optional[VerdictCache]:
+    """Build the verdict cache configured by VERDICT_CACHE_* environment variables"""
+    backend_name = os.environ.get('VERDICT_CACHE_BACKEND', 'memory').lower()
+    max_size = int(os.environ.get('VERDICT_CACHE_SIZE', 10000))
+    ttl = float(os.environ.get('VERDICT_CACHE_TTL', 3600))
+
+    if backend_name in ('', 'none', 'off'):
+        return None
+    if backend_name == 'sqlite':
+        path = os.environ.get('VERDICT_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'truthlens_verdicts.sqlite3'))
+        touch_interval = float(os.environ.get('VERDICT_CACHE_TOUCH_INTERVAL', 60))
+        backend = SQLiteCacheBackend(path, max_size, touch_interval)
+    elif backend_name == 'memory':
+        backend = MemoryCacheBackend(max_size)
+    else:
+        raise ValueError(f"Unknown VERDICT_CACHE_BACKEND '{backend_name}'")
+
+    return VerdictCache(backend, ttl)
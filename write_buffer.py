@@ -0,0 +1,204 @@
+import os
+import json
+import time
+import atexit
+import logging
+import tempfile
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy.exc import OperationalError, InterfaceError
+from app import app, db
+from models import Claim, Report
+from stats_service import record_new_claims
+from trend_store import record_trends
+from claim_dedup import absorb_duplicates
+from metrics import time_stage
+
+
+class WriteBehindBuffer:
+    """Buffers Claim and Report inserts in memory and writes them in batches.
+
+    Rows are flushed with bulk_insert_mappings in one transaction once
+    flush_size rows are pending or flush_interval seconds have passed, and
+    once more at interpreter exit. Bulk inserts bypass the ORM unit of work, so
+    the status and trend counters are updated explicitly in the same
+    transaction. Buffered rows have no id and are not visible to readers until
+    they are flushed.
+
+    A batch that fails is retried row by row. Rows the database rejects (bad
+    data, constraint violations) go to the dead-letter file instead of
+    blocking every later flush; rows that failed because the database is
+    unreachable are kept for the next flush. At most max_depth rows are held:
+    when the buffer is full, writers wait up to block_timeout for a flush and
+    are then told to write through.
+    """
+
+    def __init__(self, flush_size: int = 200, flush_interval: float = 1.0, max_depth: int = 10000,
+                 block_timeout: float = 2.0, dead_letter_path: Optional[str] = None):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_depth = max_depth
+        self.block_timeout = block_timeout
+        self.dead_letter_path = dead_letter_path or os.path.join(
+            tempfile.gettempdir(), 'truthlens_write_behind_dead_letter.ndjson'
+        )
+        self._claims: List[Dict[str, Any]] = []
+        self._reports: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._thread_pid = None
+        self.stats = {'flushes': 0, 'flushed_rows': 0, 'failures': 0, 'dead_lettered': 0,
+                      'rejected_full': 0, 'last_flush_seconds': 0.0}
+        atexit.register(self.flush)
+
+    def add_claims(self, mappings: List[Dict[str, Any]]) -> bool:
+        """Queue claim rows; False when the buffer stayed full and the caller must write them itself"""
+        return self._add(self._claims, mappings)
+
+    def add_report(self, mapping: Dict[str, Any]) -> bool:
+        return self._add(self._reports, [mapping])
+
+    def depth(self) -> int:
+        """Rows waiting to be written"""
+        with self._lock:
+            return len(self._claims) + len(self._reports)
+
+    def _add(self, pending: List[Dict[str, Any]], mappings: List[Dict[str, Any]]) -> bool:
+        self._ensure_flusher()
+        with self._space:
+            if len(self._claims) + len(self._reports) + len(mappings) > self.max_depth:
+                # Backpressure: wait for the flusher to make room
+                self._wakeup.set()
+                self._space.wait_for(
+                    lambda: len(self._claims) + len(self._reports) + len(mappings) <= self.max_depth,
+                    timeout=self.block_timeout
+                )
+                if len(self._claims) + len(self._reports) + len(mappings) > self.max_depth:
+                    self.stats['rejected_full'] += 1
+                    return False
+            pending.extend(mappings)
+            full = len(self._claims) + len(self._reports) >= self.flush_size
+        if full:
+            self._wakeup.set()
+        return True
+
+    def _ensure_flusher(self):
+        # The flusher thread does not survive fork; start one per process
+        if self._thread_pid != os.getpid():
+            self._thread_pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='write-behind-flusher', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Write every buffered row, in a single transaction when possible; returns the number written"""
+        with self._flush_lock:
+            with self._space:
+                claims, self._claims = self._claims, []
+                reports, self._reports = self._reports, []
+                self._space.notify_all()
+            if not claims and not reports:
+                return 0
+
+            started = time.perf_counter()
+            with app.app_context():
+                try:
+                    self._write(claims, reports)
+                    written = len(claims) + len(reports)
+                except Exception as e:
+                    logging.error(f"Write-behind flush of {len(claims) + len(reports)} rows failed: {str(e)}")
+                    self.stats['failures'] += 1
+                    if _is_transient(e):
+                        self._requeue(claims, reports)
+                        return 0
+                    written = self._write_rows_individually(claims, reports)
+
+            self.stats['flushes'] += 1
+            self.stats['flushed_rows'] += written
+            self.stats['last_flush_seconds'] = time.perf_counter() - started
+            return written
+
+    def _write(self, claims: List[Dict[str, Any]], reports: List[Dict[str, Any]]):
+        """Insert the rows and update the counters in one transaction; rolls back and raises on failure"""
+        try:
+            # Near-duplicates only bump their canonical claim's hit count
+            new_claims, _ = absorb_duplicates(claims) if claims else ([], [])
+            if new_claims:
+                db.session.bulk_insert_mappings(Claim, new_claims)
+                connection = db.session.connection()
+                record_new_claims(connection, [claim.get('status') for claim in new_claims])
+                record_trends(connection, new_claims)
+            if reports:
+                db.session.bulk_insert_mappings(Report, reports)
+            with time_stage('db_commit'):
+                db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            db.session.remove()
+
+    def _write_rows_individually(self, claims: List[Dict[str, Any]], reports: List[Dict[str, Any]]) -> int:
+        """Isolate the rows that broke a batch; returns the number written"""
+        written = 0
+        rows: List[Tuple[str, Dict[str, Any]]] = [('claim', row) for row in claims] + [('report', row) for row in reports]
+        for position, (kind, row) in enumerate(rows):
+            try:
+                self._write([row] if kind == 'claim' else [], [row] if kind == 'report' else [])
+                written += 1
+            except Exception as e:
+                if _is_transient(e):
+                    # The database went away mid-way: keep this row and the rest for the next flush
+                    remaining = rows[position:]
+                    self._requeue([r for k, r in remaining if k == 'claim'], [r for k, r in remaining if k == 'report'])
+                    break
+                self._dead_letter(kind, row, e)
+        return written
+
+    def _requeue(self, claims: List[Dict[str, Any]], reports: List[Dict[str, Any]]):
+        # Ahead of anything buffered since; may briefly exceed max_depth, which only delays new writers
+        with self._space:
+            self._claims = claims + self._claims
+            self._reports = reports + self._reports
+
+    def _dead_letter(self, kind: str, row: Dict[str, Any], error: Exception):
+        """Append a row the database rejected to the dead-letter file (one JSON object per line)"""
+        self.stats['dead_lettered'] += 1
+        logging.error(f"Write-behind {kind} row rejected, moved to {self.dead_letter_path}: {str(error)}")
+        entry = {'kind': kind, 'error': str(error)[:500], 'failed_at': time.time(), 'row': row}
+        try:
+            with open(self.dead_letter_path, 'a') as f:
+                f.write(json.dumps(entry, default=str) + '\n')
+        except OSError as e:
+            logging.error(f"Could not write the dead-letter file: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'depth': self.depth(), **self.stats}
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed write may succeed later unchanged (lost connection, database down or locked)"""
+    return isinstance(error, (OperationalError, InterfaceError))
+
+
+def write_behind_enabled() -> bool:
+    return os.environ.get('CLAIM_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
+
+
+write_buffer: Optional[WriteBehindBuffer] = None
+if write_behind_enabled():
+    write_buffer = WriteBehindBuffer(
+        flush_size=int(os.environ.get('WRITE_BEHIND_FLUSH_SIZE', 200)),
+        flush_interval=float(os.environ.get('WRITE_BEHIND_FLUSH_INTERVAL', 1.0)),
+        max_depth=int(os.environ.get('WRITE_BEHIND_MAX_DEPTH', 10000)),
+        block_timeout=float(os.environ.get('WRITE_BEHIND_BLOCK_TIMEOUT', 2.0)),
+        dead_letter_path=os.environ.get('WRITE_BEHIND_DEAD_LETTER_PATH')
+    )